@@ -1,13 +1,19 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.features.admin.services.dashboard import AdminDashboardService, TimePeriod
+from app.features.admin.services.dashboard import (
+    DASHBOARD_CACHE_TTL_SECONDS,
+    AdminDashboardService,
+    TimePeriod,
+)
 from app.features.admin.utils.auth import get_current_admin
 from app.platform.db.session import get_db
 from app.platform.response import api_response
 
 router = APIRouter(prefix="/dashboard", tags=["Admin - Dashboard"])
 
+_CACHE_CONTROL = f"private, max-age={DASHBOARD_CACHE_TTL_SECONDS}"
+
 
 @router.get(
     "/stats",
@@ -26,10 +32,12 @@ async def get_dashboard_stats(
     service = AdminDashboardService(db)
     stats = await service.get_dashboard_stats()
 
-    return api_response(
+    response = api_response(
         data=stats,
         message="Dashboard statistics retrieved successfully",
     )
+    response.headers["Cache-Control"] = _CACHE_CONTROL
+    return response
 
 
 @router.get(
@@ -128,10 +136,12 @@ async def get_score_distribution(
     service = AdminDashboardService(db)
     distribution = await service.get_score_distribution()
 
-    return api_response(
+    response = api_response(
         data=distribution,
         message="Score distribution retrieved successfully",
     )
+    response.headers["Cache-Control"] = _CACHE_CONTROL
+    return response
 
 
 @router.get(
@@ -152,10 +162,12 @@ async def get_scan_activity_chart(
     service = AdminDashboardService(db)
     chart_data = await service.get_scan_activity_chart(period)
 
-    return api_response(
+    response = api_response(
         data=chart_data,
         message="Scan activity chart data retrieved successfully",
     )
+    response.headers["Cache-Control"] = _CACHE_CONTROL
+    return response
 
 
 @router.get(
@@ -3,6 +3,11 @@ from typing import Optional
 
 from pydantic import BaseModel, EmailStr, field_validator
 
+_UPPERCASE_RE = re.compile(r"[A-Z]")
+_LOWERCASE_RE = re.compile(r"[a-z]")
+_DIGIT_RE = re.compile(r"\d")
+_SPECIAL_CHAR_RE = re.compile(r"[!@#$%^&*(),.?\":{}|<>]")
+
 
 class AdminRegistrationRequest(BaseModel):
     email: EmailStr
@@ -15,13 +20,13 @@ class AdminRegistrationRequest(BaseModel):
     def validate_password(cls, v: str) -> str:
         if len(v) < 8:
             raise ValueError("Password must be at least 8 characters long")
-        if not re.search(r"[A-Z]", v):
+        if not _UPPERCASE_RE.search(v):
             raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", v):
+        if not _LOWERCASE_RE.search(v):
             raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"\d", v):
+        if not _DIGIT_RE.search(v):
             raise ValueError("Password must contain at least one digit")
-        if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", v):
+        if not _SPECIAL_CHAR_RE.search(v):
             raise ValueError("Password must contain at least one special character")
         return v
 
@@ -63,13 +68,13 @@ class AdminPasswordChangeRequest(BaseModel):
     def validate_new_password(cls, v: str) -> str:
         if len(v) < 8:
             raise ValueError("Password must be at least 8 characters long")
-        if not re.search(r"[A-Z]", v):
+        if not _UPPERCASE_RE.search(v):
             raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", v):
+        if not _LOWERCASE_RE.search(v):
             raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"\d", v):
+        if not _DIGIT_RE.search(v):
             raise ValueError("Password must contain at least one digit")
-        if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", v):
+        if not _SPECIAL_CHAR_RE.search(v):
             raise ValueError("Password must contain at least one special character")
         return v
 
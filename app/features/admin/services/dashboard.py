@@ -1,3 +1,5 @@
+import time
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
 from enum import Enum
 
@@ -6,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.features.auth.models.user import User
 from app.features.leads.models.lead_model import Lead
-from app.features.scan.models.scan_job import ScanJob, ScanJobStatus
+from app.features.scan.models.scan_job import ACTIVE_SCAN_STATUSES, ScanJob, ScanJobStatus
 from app.features.sites.models.site import Site
 
 
@@ -16,29 +18,60 @@ class TimePeriod(str, Enum):
     MONTHLY = "monthly"
 
 
+# Aggregate dashboard figures are shared by every admin and are polled by the
+# UI; recomputing them more often than this buys nothing
+DASHBOARD_CACHE_TTL_SECONDS = 30
+_dashboard_cache: dict[tuple, tuple[float, dict]] = {}
+
+
 class AdminDashboardService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_dashboard_stats(self) -> dict:
-        total_leads = await self.db.scalar(select(func.count(Lead.id)))
+    @staticmethod
+    async def _cached(key: tuple, compute: Callable[[], Awaitable[dict]]) -> dict:
+        now = time.monotonic()
+        hit = _dashboard_cache.get(key)
+        if hit and hit[0] > now:
+            return hit[1]
 
-        active_users = await self.db.scalar(
-            select(func.count(User.id)).where(
-                User.last_login >= datetime.utcnow() - timedelta(days=30)
-            )
-        )
+        value = await compute()
+        _dashboard_cache[key] = (now + DASHBOARD_CACHE_TTL_SECONDS, value)
+        return value
 
-        websites_scanned = (
-            await self.db.scalar(select(func.count(func.distinct(ScanJob.site_id)))) or 0
-        )
+    async def get_dashboard_stats(self) -> dict:
+        return await self._cached(("stats",), self._compute_dashboard_stats)
+
+    async def _compute_dashboard_stats(self) -> dict:
+        # One round trip: per-table counts as scalar subqueries, user counts
+        # as conditional aggregates over a single scan of users
+        user_counts = select(
+            func.count(User.id).label("total_users"),
+            func.count(User.id)
+            .filter(User.last_login >= datetime.utcnow() - timedelta(days=30))
+            .label("active_users"),
+        ).subquery()
+
+        row = (
+            await self.db.execute(
+                select(
+                    select(func.count(Lead.id)).scalar_subquery().label("total_leads"),
+                    select(func.count(func.distinct(ScanJob.site_id)))
+                    .scalar_subquery()
+                    .label("websites_scanned"),
+                    user_counts.c.total_users,
+                    user_counts.c.active_users,
+                )
+            )
+        ).one()
 
-        total_users = await self.db.scalar(select(func.count(User.id))) or 0
+        websites_scanned = row.websites_scanned or 0
+        total_users = row.total_users or 0
         conversion_rate = (websites_scanned / total_users * 100) if total_users > 0 else 0.0
 
         return {
-            "total_leads": total_leads or 0,
-            "active_users": active_users or 0,
+            "total_leads": row.total_leads or 0,
+            "active_users": row.active_users or 0,
             "websites_scanned": websites_scanned,
             "conversion_rate": round(conversion_rate, 2),
         }
@@ -46,18 +79,7 @@ class AdminDashboardService:
     async def get_real_time_activity(self) -> dict:
         active_scans = (
             await self.db.scalar(
-                select(func.count(ScanJob.id)).where(
-                    ScanJob.status.in_(
-                        [
-                            ScanJobStatus.queued,
-                            ScanJobStatus.discovering,
-                            ScanJobStatus.selecting,
-                            ScanJobStatus.scraping,
-                            ScanJobStatus.analyzing,
-                            ScanJobStatus.aggregating,
-                        ]
-                    )
-                )
+                select(func.count(ScanJob.id)).where(ScanJob.status.in_(ACTIVE_SCAN_STATUSES))
             )
             or 0
         )
@@ -166,14 +188,24 @@ class AdminDashboardService:
         return leads_data, total
 
     async def get_score_distribution(self) -> dict:
-        total_scans = (
-            await self.db.scalar(
-                select(func.count(ScanJob.id)).where(
-                    ScanJob.status == ScanJobStatus.completed, ScanJob.score_overall.isnot(None)
-                )
+        return await self._cached(("score_distribution",), self._compute_score_distribution)
+
+    async def _compute_score_distribution(self) -> dict:
+        score = ScanJob.score_overall
+        row = (
+            await self.db.execute(
+                select(
+                    func.count(ScanJob.id).filter(score.isnot(None)).label("total_scans"),
+                    func.count(ScanJob.id).filter(score < 50).label("poor_count"),
+                    func.count(ScanJob.id)
+                    .filter(score >= 50, score < 70)
+                    .label("average_count"),
+                    func.count(ScanJob.id).filter(score >= 70).label("good_count"),
+                ).where(ScanJob.status == ScanJobStatus.completed)
             )
-            or 0
-        )
+        ).one()
+
+        total_scans = row.total_scans or 0
 
         if total_scans == 0:
             return {
@@ -186,34 +218,9 @@ class AdminDashboardService:
                 "good_count": 0,
             }
 
-        poor_count = (
-            await self.db.scalar(
-                select(func.count(ScanJob.id)).where(
-                    ScanJob.status == ScanJobStatus.completed, ScanJob.score_overall < 50
-                )
-            )
-            or 0
-        )
-
-        average_count = (
-            await self.db.scalar(
-                select(func.count(ScanJob.id)).where(
-                    ScanJob.status == ScanJobStatus.completed,
-                    ScanJob.score_overall >= 50,
-                    ScanJob.score_overall < 70,
-                )
-            )
-            or 0
-        )
-
-        good_count = (
-            await self.db.scalar(
-                select(func.count(ScanJob.id)).where(
-                    ScanJob.status == ScanJobStatus.completed, ScanJob.score_overall >= 70
-                )
-            )
-            or 0
-        )
+        poor_count = row.poor_count or 0
+        average_count = row.average_count or 0
+        good_count = row.good_count or 0
 
         return {
             "poor_percentage": round((poor_count / total_scans) * 100, 2),
@@ -226,6 +233,11 @@ class AdminDashboardService:
         }
 
     async def get_scan_activity_chart(self, period: TimePeriod = TimePeriod.WEEKLY) -> dict:
+        return await self._cached(
+            ("scan_activity_chart", period), lambda: self._compute_scan_activity_chart(period)
+        )
+
+    async def _compute_scan_activity_chart(self, period: TimePeriod) -> dict:
         """
         Get scan activity data for charts based on time period.
         Returns daily data for the specified period with comparison to previous period.
@@ -256,28 +268,25 @@ class AdminDashboardService:
             date_format = func.date_trunc("month", ScanJob.created_at)
             group_by = func.date_trunc("month", ScanJob.created_at)
 
-        # Current period data
-        current_query = (
-            select(group_by.label("period"), func.count(ScanJob.id).label("scan_count"))
-            .where(ScanJob.created_at >= current_start)
+        # Both periods in one pass; each bucket carries its current and
+        # previous-period counts and we split them in Python
+        activity_query = (
+            select(
+                group_by.label("period"),
+                func.count(ScanJob.id).filter(ScanJob.created_at >= current_start).label("scan_count"),
+                func.count(ScanJob.id)
+                .filter(ScanJob.created_at <= previous_end)
+                .label("previous_count"),
+            )
+            .where(ScanJob.created_at >= previous_start)
             .where(ScanJob.created_at <= now)
             .group_by(group_by)
             .order_by(group_by)
         )
 
-        current_result = await self.db.execute(current_query)
-        current_data = {row.period: row.scan_count for row in current_result}
-
-        # Previous period data for comparison
-        previous_query = (
-            select(group_by.label("period"), func.count(ScanJob.id).label("scan_count"))
-            .where(ScanJob.created_at >= previous_start)
-            .where(ScanJob.created_at <= previous_end)
-            .group_by(group_by)
-        )
-
-        previous_result = await self.db.execute(previous_query)
-        previous_data = {row.period: row.scan_count for row in previous_result}
+        rows = (await self.db.execute(activity_query)).all()
+        current_data = {row.period: row.scan_count for row in rows if row.scan_count}
+        previous_data = {row.period: row.previous_count for row in rows if row.previous_count}
 
         # Calculate percentage change
         current_total = sum(current_data.values())
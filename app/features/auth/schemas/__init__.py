@@ -2,6 +2,10 @@ from pydantic import BaseModel, EmailStr, field_validator
 from datetime import datetime
 import re
 
+_UPPERCASE_RE = re.compile(r'[A-Z]')
+_LOWERCASE_RE = re.compile(r'[a-z]')
+_DIGIT_RE = re.compile(r'\d')
+
 class ForgetPasswordRequest(BaseModel):
     email: EmailStr
 
@@ -20,11 +24,11 @@ class ForgotResetTokenRequest(BaseModel):
         """Validate password strength"""
         if len(v) < 8:
             raise ValueError('Password must be at least 8 characters long')
-        if not re.search(r'[A-Z]', v):
+        if not _UPPERCASE_RE.search(v):
             raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
+        if not _LOWERCASE_RE.search(v):
             raise ValueError('Password must contain at least one lowercase letter')
-        if not re.search(r'\d', v):
+        if not _DIGIT_RE.search(v):
             raise ValueError('Password must contain at least one digit')
         return v
 
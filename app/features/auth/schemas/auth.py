@@ -4,7 +4,14 @@ from datetime import datetime
 from typing import Optional
 import enum
 
-from pydantic import BaseModel, EmailStr, Field, field_serializer, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_serializer, field_validator
+
+_USERNAME_RE = re.compile(r"^[a-zA-Z0-9_-]+$")
+_UPPERCASE_RE = re.compile(r"[A-Z]")
+_LOWERCASE_RE = re.compile(r"[a-z]")
+_DIGIT_RE = re.compile(r"\d")
+_PHONE_CHARS_RE = re.compile(r"^[\d\s\+\-\(\)]+$")
+_NON_DIGIT_RE = re.compile(r"[^\d]")
 
 
 class SignupRequest(BaseModel):
@@ -14,13 +21,19 @@ class SignupRequest(BaseModel):
     )
     password: str = Field(..., min_length=8, description="Password must be at least 8 characters")
 
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, v: str) -> str:
+        """Store and look up emails in lower case"""
+        return v.lower()
+
     @field_validator("username")
     @classmethod
     def validate_username(cls, v: str) -> str:
         """Validate username contains only alphanumeric characters, underscores, and hyphens"""
-        if not re.match(r"^[a-zA-Z0-9_-]+$", v):
+        if not _USERNAME_RE.match(v):
             raise ValueError("Username can only contain letters, numbers, underscores, and hyphens")
-        return v.strip()
+        return v.lower()
 
     @field_validator("password")
     @classmethod
@@ -28,11 +41,11 @@ class SignupRequest(BaseModel):
         """Validate password strength"""
         if len(v) < 8:
             raise ValueError("Password must be at least 8 characters long")
-        if not re.search(r"[A-Z]", v):
+        if not _UPPERCASE_RE.search(v):
             raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", v):
+        if not _LOWERCASE_RE.search(v):
             raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"\d", v):
+        if not _DIGIT_RE.search(v):
             raise ValueError("Password must contain at least one digit")
         return v
 
@@ -69,14 +82,19 @@ class UserResponse(BaseModel):
             return value.isoformat()
         return value
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class LoginRequest(BaseModel):
     email: EmailStr
     password: str
 
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, v: str) -> str:
+        """Look up emails in lower case"""
+        return v.lower()
+
 
 class PasswordResetRequest(BaseModel):
     email: EmailStr
@@ -92,11 +110,11 @@ class PasswordResetConfirm(BaseModel):
         """Validate password strength"""
         if len(v) < 8:
             raise ValueError("Password must be at least 8 characters long")
-        if not re.search(r"[A-Z]", v):
+        if not _UPPERCASE_RE.search(v):
             raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", v):
+        if not _LOWERCASE_RE.search(v):
             raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"\d", v):
+        if not _DIGIT_RE.search(v):
             raise ValueError("Password must contain at least one digit")
         return v
 
@@ -119,11 +137,11 @@ class UpdateProfileRequest(BaseModel):
         cleaned = v.strip()
         
         # Check if phone number contains only valid characters: digits, +, -, spaces, and parentheses
-        if not re.match(r'^[\d\s\+\-\(\)]+$', cleaned):
+        if not _PHONE_CHARS_RE.match(cleaned):
             raise ValueError("Phone number can only contain digits, spaces, +, -, and parentheses")
         
         # Extract only digits to check minimum length
-        digits_only = re.sub(r'[^\d]', '', cleaned)
+        digits_only = _NON_DIGIT_RE.sub('', cleaned)
         if len(digits_only) < 10:
             raise ValueError("Phone number must contain at least 10 digits")
         
@@ -142,11 +160,11 @@ class ChangePasswordRequest(BaseModel):
     def validate_password(cls, v: str) -> str:
         if len(v) < 8:
             raise ValueError("Password must be at least 8 characters long")
-        if not re.search(r"[A-Z]", v):
+        if not _UPPERCASE_RE.search(v):
             raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", v):
+        if not _LOWERCASE_RE.search(v):
             raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"\d", v):
+        if not _DIGIT_RE.search(v):
             raise ValueError("Password must contain at least one digit")
         return v
 
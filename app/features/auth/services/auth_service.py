@@ -28,7 +28,7 @@ class AuthService:
     async def register_user(self, request: SignupRequest) -> tuple[TokenResponse, str]:
 
         email_check = await self.db.execute(
-            select(User).where(User.email == request.email.lower())
+            select(User).where(User.email == request.email)
         )
         if email_check.scalar_one_or_none():
             raise HTTPException(
@@ -36,7 +36,7 @@ class AuthService:
             )
 
         username_check = await self.db.execute(
-            select(User).where(User.username == request.username.lower())
+            select(User).where(User.username == request.username)
         )
         if username_check.scalar_one_or_none():
             raise HTTPException(
@@ -46,8 +46,8 @@ class AuthService:
        
         
         new_user = User(
-            email=request.email.lower(),
-            username=request.username.lower(),
+            email=request.email,
+            username=request.username,
             password_hash=hash_password(request.password),
             is_email_verified=True,
         )
@@ -89,7 +89,7 @@ class AuthService:
 
     async def login_user(self, request: LoginRequest) -> TokenResponse:  
         result = await self.db.execute(
-            select(User).where(User.email == request.email.lower())
+            select(User).where(User.email == request.email)
         )
         user = result.scalar_one_or_none()
 
@@ -10,6 +10,8 @@ from google.oauth2 import id_token
 # from app.platform.config import GOOGLE_CLIENT_ID, GOOGLE_CLIENT_ID_ANDROID
 from app.platform.config import settings
 
+_GOOGLE_ISSUERS = frozenset(("accounts.google.com", "https://accounts.google.com"))
+
 
 class GoogleOAuthVerifier:
     """Utility class for verifying Google ID tokens"""
@@ -44,7 +46,7 @@ class GoogleOAuthVerifier:
 
             idinfo = id_token.verify_oauth2_token(token, requests.Request(), client_id)
 
-            if idinfo["iss"] not in ["accounts.google.com", "https://accounts.google.com"]:
+            if idinfo["iss"] not in _GOOGLE_ISSUERS:
                 raise ValueError("Wrong issuer.")
 
             return {
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 class LeadCreate(BaseModel):
     email: EmailStr = Field(..., description="Lead email")
@@ -7,5 +7,4 @@ class LeadOut(BaseModel):
     id: str
     email: EmailStr
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -8,6 +8,13 @@ from app.platform.config import settings
 from jinja2 import Environment, FileSystemLoader, ChoiceLoader
 from pathlib import Path
 
+# Built once so compiled templates are cached across sends
+_lead_templates = Path(__file__).resolve().parent.parent / "template"
+_base_templates = Path(__file__).resolve().parents[2] / "auth" / "template"
+env = Environment(loader=ChoiceLoader([FileSystemLoader(str(_lead_templates)),
+                                       FileSystemLoader(str(_base_templates))]))
+
+
 class LeadService:
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -23,23 +30,14 @@ class LeadService:
         await self.db.refresh(lead)
         return lead
 
-    @staticmethod
-    def _env() -> Environment:
-        lead_templates = Path(__file__).resolve().parent.parent / "template"
-        base_template = Path(__file__).resolve().parents[2] / "auth" / "template"
-        return Environment(loader=ChoiceLoader([FileSystemLoader(str(lead_templates)),
-                                               FileSystemLoader(str(base_template))]))
-
     @classmethod
     async def send_lead_confirmation(cls, lead: Lead) -> None:
-        env = cls._env()
         template = env.get_template("lead_confirmation.html")
         html = template.render(lead=lead)
         send_email(lead.email, "We got your request - Sitelytics", html)
 
     @classmethod
     async def send_admin_notification(cls, lead: Lead) -> None:
-        env = cls._env()
         template = env.get_template("lead_admin_notification.html")
         html = template.render(lead=lead)
         send_email(settings.MAIL_ADMIN_EMAIL, f"New Lead: {lead.email}", html)
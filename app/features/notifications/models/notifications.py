@@ -1,6 +1,6 @@
 import enum
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, String, Text
+from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Index, String, Text
 from sqlalchemy.orm import relationship
 
 from app.platform.db.base import BaseModel
@@ -46,6 +46,19 @@ class Notification(BaseModel):
     read_at = Column(DateTime, nullable=True)
     user = relationship("User")
 
+    __table_args__ = (
+        # Keyset pagination: WHERE user_id = ? AND id < ? ORDER BY id DESC
+        Index("ix_notifications_user_id_id", "user_id", "id"),
+        # Unread badge counts, unread_only pages and mark-all-as-read only
+        # touch unread rows, a small slice once users catch up
+        Index(
+            "ix_notifications_user_id_unread",
+            "user_id",
+            "id",
+            postgresql_where=is_read.is_(False),
+        ),
+    )
+
     def __repr__(self):
         return f"<Notification(id={self.id}, user_id={self.user_id}, type={self.type}, is_read={self.is_read})>"
 
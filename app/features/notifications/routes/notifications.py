@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.features.auth.models.user import User
@@ -16,12 +17,15 @@ from app.platform.response import api_response
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
+_notification_list_adapter = TypeAdapter(list[NotificationResponse])
+
 
 @router.get("", response_model=NotificationListResponse)
 async def get_notifications(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     unread_only: bool = Query(False),
+    cursor: str | None = Query(None, description="Id of the last notification from the previous page"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -32,19 +36,21 @@ async def get_notifications(
         skip=skip,
         limit=limit,
         unread_only=unread_only,
+        cursor=cursor,
     )
 
-    notification_responses = [
-        NotificationResponse.model_validate(notification) for notification in notifications
-    ]
+    notification_responses = _notification_list_adapter.validate_python(
+        notifications, from_attributes=True
+    )
 
     return api_response(
         status_code=status.HTTP_200_OK,
         data={
-            "notifications": NotificationListResponse(
+            "notifications": NotificationListResponse.build(
                 notifications=notification_responses,
                 total=total,
                 unread_count=unread_count,
+                next_cursor=notifications[-1].id if len(notifications) == limit else None,
             ),
         },
     )
@@ -57,11 +63,7 @@ async def get_unread_count(
 ):
     """Get count of unread notifications."""
     service = NotificationService(db)
-    _, _, unread_count = await service.get_user_notifications(
-        user_id=str(current_user.id),
-        skip=0,
-        limit=1,
-    )
+    unread_count = await service.count_unread(str(current_user.id))
 
     return api_response(data={"unread_count": unread_count})
 
@@ -6,6 +6,7 @@ Provides WebSocket endpoint for clients to receive real-time notification update
 
 import asyncio
 
+import orjson
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -18,6 +19,8 @@ logger = get_logger(__name__)
 
 router = APIRouter(tags=["WebSocket Notifications"])
 
+_HEARTBEAT = orjson.dumps({"type": "heartbeat", "data": {"status": "alive"}}).decode()
+
 
 @router.websocket("/ws/notifications")
 async def websocket_notifications_endpoint(
@@ -63,26 +66,23 @@ async def websocket_notifications_endpoint(
         logger.info(f"WebSocket connection established for user {user_id}")
 
         # Send welcome message
-        await websocket.send_json(
-            {
-                "type": "connected",
-                "data": {
-                    "message": "Successfully connected to notification stream",
-                    "user_id": user_id,
-                },
-            }
+        await websocket.send_text(
+            orjson.dumps(
+                {
+                    "type": "connected",
+                    "data": {
+                        "message": "Successfully connected to notification stream",
+                        "user_id": user_id,
+                    },
+                }
+            ).decode()
         )
 
         # Keep the connection alive with periodic heartbeats
         while True:
             # Send heartbeat every 30 seconds to keep connection alive
             await asyncio.sleep(30)
-            await websocket.send_json(
-                {
-                    "type": "heartbeat",
-                    "data": {"status": "alive"},
-                }
-            )
+            await websocket.send_text(_HEARTBEAT)
 
     except WebSocketDisconnect:
         logger.info(f"WebSocket disconnected for user {user_id}")
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Generic, Optional, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -30,14 +30,43 @@ class NotificationResponse(NotificationBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class NotificationPushPayload(NotificationBase):
+    """Notification as pushed to connected devices over WebSocket."""
+
+    id: str
+    user_id: str
+    priority: str
+    action_url: Optional[str] = None
+    is_read: bool
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class NotificationListResponse(BaseModel):
     notifications: list[NotificationResponse]
     total: int
     unread_count: int
+    next_cursor: Optional[str] = None
+
+    @classmethod
+    def build(
+        cls,
+        notifications: list[NotificationResponse],
+        total: int,
+        unread_count: int,
+        next_cursor: Optional[str] = None,
+    ) -> "NotificationListResponse":
+        """Wrap already-validated items without validating the list again."""
+        return cls.model_construct(
+            notifications=notifications,
+            total=total,
+            unread_count=unread_count,
+            next_cursor=next_cursor,
+        )
 
 
 class MarkAsReadRequest(BaseModel):
@@ -60,5 +89,4 @@ class NotificationSettingsResponse(NotificationSettingsBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -1,9 +1,10 @@
 import json
-from datetime import datetime, timezone
 from typing import Any, Optional
 
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import and_, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.features.notifications.models.notifications import (
     Notification,
@@ -11,12 +12,17 @@ from app.features.notifications.models.notifications import (
     NotificationSettings,
     NotificationType,
 )
+from app.features.notifications.schemas.notifications import NotificationPushPayload
 from app.features.notifications.services.push_notification import PushNotificationService
+from app.platform.db.base import utc_now
 from app.platform.logger import get_logger
 from app.platform.services.email import send_email
 
 logger = get_logger(__name__)
 
+# NotificationSettings columns a user may change
+_UPDATABLE_SETTINGS = frozenset(("email_enabled", "push_enabled"))
+
 
 class NotificationService:
     def __init__(self, db: AsyncSession):
@@ -69,39 +75,53 @@ class NotificationService:
         skip: int = 0,
         limit: int = 50,
         unread_only: bool = False,
+        cursor: Optional[str] = None,
     ) -> tuple[list[Notification], int, int]:
         """
         Get user notifications with pagination.
+
+        Pass the last seen notification id as ``cursor`` to page without
+        OFFSET; ids are UUIDv7 so they sort in creation order. Relationships
+        are not loaded; touching one on a returned row raises instead of
+        issuing a query per notification.
         Returns: (notifications, total_count, unread_count)
         """
         # Build query
-        query = select(Notification).where(Notification.user_id == user_id)
+        query = (
+            select(Notification)
+            .where(Notification.user_id == user_id)
+            .options(raiseload("*"))
+        )
 
         if unread_only:
             query = query.where(Notification.is_read.is_(False))
 
-        # Get total count
-        count_query = (
-            select(func.count()).select_from(Notification).where(Notification.user_id == user_id)
-        )
-        total_result = await self.db.execute(count_query)
-        total_count = total_result.scalar_one()
+        if cursor:
+            query = query.where(Notification.id < cursor)
 
-        # Get unread count
-        unread_query = (
-            select(func.count())
-            .select_from(Notification)
-            .where(and_(Notification.user_id == user_id, Notification.is_read.is_(False)))
-        )
-        unread_result = await self.db.execute(unread_query)
-        unread_count = unread_result.scalar_one()
+        # Total and unread counts in one pass over the user's rows
+        count_query = select(
+            func.count(),
+            func.count().filter(Notification.is_read.is_(False)),
+        ).where(Notification.user_id == user_id)
+        total_count, unread_count = (await self.db.execute(count_query)).one()
 
-        query = query.order_by(Notification.created_at.desc()).offset(skip).limit(limit)
+        query = query.order_by(Notification.id.desc()).offset(skip).limit(limit)
         result = await self.db.execute(query)
         notifications = result.scalars().all()
 
         return list(notifications), total_count, unread_count
 
+    async def count_unread(self, user_id: str) -> int:
+        """Count a user's unread notifications."""
+        unread_query = (
+            select(func.count())
+            .select_from(Notification)
+            .where(and_(Notification.user_id == user_id, Notification.is_read.is_(False)))
+        )
+        result = await self.db.execute(unread_query)
+        return result.scalar_one()
+
     async def mark_as_read(self, user_id: str, notification_ids: list[str]) -> int:
         """
         Mark notifications as read. Returns number of updated notifications.
@@ -117,7 +137,7 @@ class NotificationService:
                     Notification.is_read.is_(False),
                 )
             )
-            .values(is_read=True, read_at=datetime.now(timezone.utc))
+            .values(is_read=True, read_at=utc_now())
         )
         result = await self.db.execute(stmt)
         await self.db.commit()
@@ -131,7 +151,7 @@ class NotificationService:
             update(Notification).where(
                 and_(Notification.user_id == user_id, Notification.is_read.is_(False))
             )
-        ).values(is_read=True, read_at=datetime.now(timezone.utc))
+        ).values(is_read=True, read_at=utc_now())
         result = await self.db.execute(stmt)
         await self.db.commit()
         return result.rowcount  # type: ignore
@@ -178,13 +198,31 @@ class NotificationService:
         """
         Create or update user notification settings.
         """
-        settings = await self.get_user_settings(user_id)
+        values = {
+            key: value
+            for key, value in settings_data.items()
+            if key in _UPDATABLE_SETTINGS and value is not None
+        }
+        if not values:
+            return await self.get_user_settings(user_id)
+
+        # Existing row: one UPDATE ... RETURNING instead of SELECT, UPDATE, SELECT
+        stmt = (
+            update(NotificationSettings)
+            .where(NotificationSettings.user_id == user_id)
+            .values(**values)
+            .returning(NotificationSettings)
+        )
+        settings = (await self.db.execute(stmt)).scalar_one_or_none()
+
+        if settings is None:
+            settings = NotificationSettings(user_id=user_id, **values)
+            self.db.add(settings)
+            await self.db.commit()
+            await self.db.refresh(settings)
+            return settings
 
-        for key, value in settings_data.items():
-            if hasattr(settings, key) and value is not None:
-                setattr(settings, key, value)
         await self.db.commit()
-        await self.db.refresh(settings)
         return settings
 
     async def _send_email_notification(self, user_id: str, title: str, message: str):
@@ -201,7 +239,8 @@ class NotificationService:
             <p>{message}</p>
             <p>This is an automated notification from Site Audit AI.</p>
             """
-            send_email(str(user.email), title, email_body)
+            # send_email is blocking SMTP/HTTP I/O; keep it off the event loop
+            await run_in_threadpool(send_email, str(user.email), title, email_body)
 
     async def _send_push_notification(self):
         # TODO: push notifications
@@ -218,18 +257,7 @@ class NotificationService:
         try:
             from app.platform.websocket_manager import manager
 
-            # Serialize notification to dictionary
-            notification_data = {
-                "id": str(notification.id),
-                "user_id": str(notification.user_id),
-                "title": notification.title,
-                "message": notification.message,
-                "notification_type": notification.notification_type.value,
-                "priority": notification.priority.value,
-                "action_url": notification.action_url,
-                "is_read": notification.is_read,
-                "created_at": notification.created_at.isoformat(),
-            }
+            notification_data = NotificationPushPayload.model_validate(notification).model_dump(mode="json")
 
             # Send to user's connected devices
             message = {"type": "notification", "data": notification_data}
@@ -1,5 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, update
 from sqlalchemy.orm import joinedload
 from fastapi import HTTPException, status
 
@@ -82,8 +82,12 @@ class ReferralLinkService:
             ip_address=ip_address
         )
         
-        # Increment click count
-        link.total_clicks += 1
+        # Increment click count in SQL so concurrent clicks aren't lost
+        await self.db.execute(
+            update(ReferralLink)
+            .where(ReferralLink.id == link.id)
+            .values(total_clicks=ReferralLink.total_clicks + 1)
+        )
         
         self.db.add(click)
         try:
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.features.request_form.schemas.request_schema import (
@@ -16,6 +17,8 @@ from app.platform.logger import get_logger
 router = APIRouter(prefix="/request-form", tags=["Request Form"])
 logger = get_logger(__name__)
 
+_request_list_adapter = TypeAdapter(list[RequestFormResponse])
+
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def submit_request_form(
@@ -66,7 +69,7 @@ async def list_requests_for_user(
     requests = await service.list_all_requests_for_user(user_id)
     return api_response(
         message="Requests retrieved",
-        data=[RequestFormResponse.model_validate(req) for req in requests],
+        data=_request_list_adapter.validate_python(requests, from_attributes=True),
         status_code=status.HTTP_200_OK
     )
 
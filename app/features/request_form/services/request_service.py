@@ -11,6 +11,16 @@ from app.features.auth.models.user import User
 
 logger = get_logger(__name__)
 
+# Built once so compiled templates are cached across sends
+_request_templates = Path(__file__).resolve().parent.parent / "template"
+_base_templates = Path(__file__).resolve().parent.parent.parent / "auth" / "template"
+env = Environment(
+    loader=ChoiceLoader([
+        FileSystemLoader(str(_request_templates)),
+        FileSystemLoader(str(_base_templates)),
+    ])
+)
+
 
 class RequestFormService:
     def __init__(self, db: AsyncSession):
@@ -111,16 +121,6 @@ class RequestFormService:
     
 
     async def send_notification(self, request_id, user_email, username) -> None:
-        support_templates = Path(__file__).resolve().parent.parent / "template"
-        base_template = Path(__file__).resolve().parent.parent.parent / "auth" / "template"
-
-
-        env = Environment(
-        loader=ChoiceLoader([
-            FileSystemLoader(str(support_templates)),
-            FileSystemLoader(str(base_template)),
-        ])
-    )
         template = env.get_template("request_form_email.html")
         
         html_content = template.render({
@@ -1,5 +1,5 @@
 from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Index, UniqueConstraint, Enum
-from datetime import datetime, date
+from datetime import datetime
 import enum
 
 from app.platform.db.base import BaseModel
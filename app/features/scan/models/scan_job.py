@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Float, DateTime, Text, ForeignKey, Index, CheckConstraint, Enum
+from sqlalchemy import Column, String, Integer, Float, DateTime, Text, ForeignKey, Index, CheckConstraint, Enum, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -19,6 +19,17 @@ class ScanJobStatus(enum.Enum):
     cancelled = "cancelled"
 
 
+# Statuses of a scan that is still in flight
+ACTIVE_SCAN_STATUSES = (
+    ScanJobStatus.queued,
+    ScanJobStatus.discovering,
+    ScanJobStatus.selecting,
+    ScanJobStatus.scraping,
+    ScanJobStatus.analyzing,
+    ScanJobStatus.aggregating,
+)
+
+
 class ScanJob(BaseModel):
   
     __tablename__ = "scan_jobs"
@@ -83,5 +94,15 @@ class ScanJob(BaseModel):
             name='check_owner_exclusivity'
         ),
         Index('idx_scan_jobs_status', 'status'),
+        Index('idx_scan_jobs_created_at', 'created_at'),  # admin activity charts range-scan on this
         Index('idx_scan_jobs_user_site', 'site_id', postgresql_where=Column('site_id').isnot(None)),
+        # Active scans are a small slice of the table; queries must filter on
+        # exactly ACTIVE_SCAN_STATUSES for the planner to use this
+        Index(
+            'idx_scan_jobs_active',
+            'status',
+            postgresql_where=text(
+                "status IN ({})".format(", ".join(f"'{s.name}'" for s in ACTIVE_SCAN_STATUSES))
+            ),
+        ),
     )
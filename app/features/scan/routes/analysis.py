@@ -1,4 +1,5 @@
 from fastapi import APIRouter, status, Depends
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
 from typing import Dict, Any
@@ -12,7 +13,7 @@ from app.features.scan.models.scan_page import ScanPage
 from app.features.scan.models.scan_issue import ScanIssue, IssueCategory, IssueSeverity
 from app.platform.response import api_response
 from app.platform.db.session import get_db
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +24,8 @@ class TestAnalysisRequest(BaseModel):
     """Request for testing analysis without database"""
     extractor_data: Dict[Any, Any]
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "extractor_data": {
                     "status_code": 200,
@@ -58,7 +59,8 @@ class TestAnalysisRequest(BaseModel):
                     }
                 }
             }
-        }
+        },
+    )
 
 
 @router.post("/test", summary="Test analysis without database")
@@ -86,7 +88,7 @@ async def test_analysis(data: TestAnalysisRequest):
         logger.info("Testing PageAnalyzerService with provided extractor data")
 
         # Call PageAnalyzerService directly
-        analysis_result = PageAnalyzerService.analyze_page(data.extractor_data)
+        analysis_result = await run_in_threadpool(PageAnalyzerService.analyze_page, data.extractor_data)
 
         logger.info(
             f"Analysis complete: Overall score {analysis_result.get('overall_score')}/100")
@@ -168,8 +170,9 @@ async def analyze_pages(
 
                 # Call PageAnalyzerService to analyze
                 logger.info(f"Analyzing page: {page.page_url}")
-                analysis_result = PageAnalyzerService.analyze_page(
-                    extractor_response)
+                # analyze_page makes a blocking LLM call
+                analysis_result = await run_in_threadpool(
+                    PageAnalyzerService.analyze_page, extractor_response)
 
                 # Update ScanPage with scores and structured analysis
                 page.score_overall = analysis_result.get("overall_score")
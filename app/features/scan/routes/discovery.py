@@ -1,7 +1,8 @@
 from fastapi import APIRouter, status, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, ConfigDict, HttpUrl
 from typing import List, Optional
 
 from app.features.scan.schemas.scan import DiscoveryRequest, DiscoveryResponse
@@ -23,12 +24,13 @@ class DiscoverUrlsRequest(BaseModel):
     """Request schema for URL discovery"""
     url: HttpUrl
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "url": "https://example.com"
             }
-        }
+        },
+    )
 
 
 class DiscoveredUrl(BaseModel):
@@ -119,7 +121,9 @@ async def discover_important_urls(
         
         # Step 1: Discover up to 10 pages
         discovery_service = PageDiscoveryService()
-        discovered_pages = discovery_service.discover_pages(
+        # Selenium crawl is blocking; keep it off the event loop
+        discovered_pages = await run_in_threadpool(
+            discovery_service.discover_pages,
             url=validated_url,
             max_pages=10
         )
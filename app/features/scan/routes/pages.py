@@ -1,6 +1,6 @@
 from fastapi import APIRouter, status, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from app.features.scan.schemas.scan import (
     GetPagesRequest,
@@ -116,26 +116,12 @@ async def toggle_page_selection(
         TogglePageSelectionResponse with updated selection status
     """
     try:
-        # Get the page
-        query = select(ScanPage).where(ScanPage.id == data.page_id)
-        result = await db.execute(query)
-        page = result.scalar_one_or_none()
-        
-        if not page:
-            return api_response(
-                status_code=status.HTTP_404_NOT_FOUND,
-                message="Page not found",
-                data={}
-            )
-        
         # Apply action
         if data.action == "select":
-            page.is_manually_selected = True
-            page.is_manually_deselected = False
+            selected = True
             message = f"Page manually selected for scanning"
         elif data.action == "deselect":
-            page.is_manually_selected = False
-            page.is_manually_deselected = True
+            selected = False
             message = f"Page manually excluded from scanning"
         else:
             return api_response(
@@ -144,14 +130,30 @@ async def toggle_page_selection(
                 data={}
             )
         
+        # Single UPDATE ... RETURNING instead of load, modify, commit, refresh
+        result = await db.execute(
+            update(ScanPage)
+            .where(ScanPage.id == data.page_id)
+            .values(is_manually_selected=selected, is_manually_deselected=not selected)
+            .returning(ScanPage.id, ScanPage.page_url)
+        )
+        page = result.first()
+        
+        if not page:
+            return api_response(
+                status_code=status.HTTP_404_NOT_FOUND,
+                message="Page not found",
+                data={}
+            )
+        
         await db.commit()
-        await db.refresh(page)
         
+        # A manual override always wins over the LLM selection
         return api_response(
             data={
                 "page_id": page.id,
                 "page_url": page.page_url,
-                "is_selected": page.is_selected,
+                "is_selected": selected,
                 "message": message
             }
         )
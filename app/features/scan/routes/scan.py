@@ -5,10 +5,11 @@ import hashlib
 from urllib.parse import urlparse
 from sse_starlette.sse import EventSourceResponse
 from fastapi import APIRouter, HTTPException, status, BackgroundTasks, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends, Response
-from sqlalchemy import select, func
+from sqlalchemy import select, func, update
 from sqlalchemy.orm import aliased
 from datetime import datetime
 from urllib.parse import urlparse
@@ -34,6 +35,7 @@ from app.features.scan.models.scan_job import ScanJob, ScanJobStatus
 from app.features.scan.models.scan_page import ScanPage
 from app.features.scan.models.scan_issue import ScanIssue
 from app.features.sites.models.site import Site
+from app.features.sites.services.site import get_or_create_site
 from app.features.scan.services.discovery.page_discovery import PageDiscoveryService
 from app.features.scan.services.analysis.page_selector import PageSelectorService
 from app.features.scan.services.analysis.page_analyzer import PageAnalyzerService
@@ -52,6 +54,9 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/scan", tags=["scan"])
 
+# SSE events after which the stream is closed
+_TERMINAL_EVENTS = frozenset(("scan_complete", "scan_error"))
+
 @router.post("/start-scan-sse")
 async def start_scan_sse(
     url: str,
@@ -116,29 +121,7 @@ async def start_scan_sse(
         # For ScanJob: use device_id only for anonymous users
         device_id_for_scan = device_id_raw if not user_id else None
         
-        if user_id:
-            site_query = select(Site).where(
-                Site.root_url == url_str,
-                Site.user_id == user_id
-            )
-        else:
-            site_query = select(Site).where(
-                Site.root_url == url_str,
-                Site.device_id == device_id_for_scan
-            )
-        
-        result = await db.execute(site_query)
-        site = result.scalar_one_or_none()
-        
-        if not site:
-            site = Site(
-                user_id=user_id,
-                device_id=device_id_for_scan,
-                root_url=url_str,
-                total_scans=0
-            )
-            db.add(site)
-            await db.flush()
+        site = await get_or_create_site(db, url_str, user_id=user_id, device_id=device_id_for_scan)
         
         scan_job = ScanJob(
             user_id=user_id,
@@ -199,7 +182,7 @@ async def start_scan_sse(
                             
                             logger.info(f"[SSE] Sent {event_type} event to job {job_id}")
                             
-                            if event_type in ["scan_complete", "scan_error"]:
+                            if event_type in _TERMINAL_EVENTS:
                                 logger.info(f"[SSE] Closing connection for job {job_id} ({event_type})")
                                 break
                                 
@@ -316,30 +299,7 @@ async def start_scan(
         device_id_for_scan = device_id_raw if not user_id else None
 
         # Check if Site exists for this user (or anonymous), create if not
-        if user_id:
-            # For authenticated users, check for their site
-            site_query = select(Site).where(
-                Site.root_url == url_str,
-                Site.user_id == user_id
-            )
-        else:
-            # For anonymous users, check for anonymous site by device_id
-            site_query = select(Site).where(
-                Site.root_url == url_str,
-                Site.device_id == device_id_for_scan
-            )
-        result = await db.execute(site_query)
-        site = result.scalar_one_or_none()
-
-        if not site:
-            site = Site(
-                user_id=user_id,
-                device_id=device_id_for_scan,  # Include device_id for anonymous users
-                root_url=url_str,
-                total_scans=0
-            )
-            db.add(site)
-            await db.flush()
+        site = await get_or_create_site(db, url_str, user_id=user_id, device_id=device_id_for_scan)
 
         # Create ScanJob
 
@@ -358,7 +318,9 @@ async def start_scan(
         await increment_scan_count(db, device_session)
 
         discovery_service = PageDiscoveryService()
-        discovered_pages = discovery_service.discover_pages(
+        # Selenium crawl is blocking; keep it off the event loop
+        discovered_pages = await run_in_threadpool(
+            discovery_service.discover_pages,
             url=url_str,
             max_pages=1
         )
@@ -381,7 +343,9 @@ async def start_scan(
         await db.flush()
 
         selector_service = PageSelectorService()
-        selected_urls = selector_service.filter_important_pages(
+        # Sync OpenAI client, so off the event loop
+        selected_urls = await run_in_threadpool(
+            selector_service.filter_important_pages,
             pages=discovered_pages,
             top_n=data.top_n,
             referer=url_str,
@@ -401,9 +365,12 @@ async def start_scan(
             if page.page_url_normalized in selected_normalized:
                 page.is_selected_by_llm = True
 
-        # Update site stats
-        site.total_scans += 1
-        site.last_scanned_at = datetime.utcnow()
+        # Update site stats in SQL so concurrent scans don't lose increments
+        await db.execute(
+            update(Site)
+            .where(Site.id == site.id)
+            .values(total_scans=Site.total_scans + 1, last_scanned_at=func.now())
+        )
 
         await db.commit()
         await db.refresh(scan_job)
@@ -508,28 +475,7 @@ async def start_scan_async(
         # For ScanJob: use device_id only for anonymous users
         device_id_for_scan = device_id_raw if not user_id else None
 
-        if user_id:
-            site_query = select(Site).where(
-                Site.root_url == url_str,
-                Site.user_id == user_id
-            )
-        else:
-            site_query = select(Site).where(
-                Site.root_url == url_str,
-                Site.device_id == device_id_for_scan
-            )
-        result = await db.execute(site_query)
-        site = result.scalar_one_or_none()
-
-        if not site:
-            site = Site(
-                user_id=user_id,
-                device_id=device_id_for_scan,
-                root_url=url_str,
-                total_scans=0
-            )
-            db.add(site)
-            await db.flush()
+        site = await get_or_create_site(db, url_str, user_id=user_id, device_id=device_id_for_scan)
 
         scan_job = ScanJob(
             user_id=user_id,
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, status, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -14,6 +15,36 @@ import hashlib
 router = APIRouter(prefix="/scan/scraping", tags=["scan-scraping"])
 
 
+# Selenium is blocking; these run in the threadpool so a slow page load
+# doesn't stall every other request on the event loop.
+def _extract_from_url(page_url: str) -> dict:
+    driver = ScrapingService.load_page(page_url)
+    try:
+        return ExtractorService.extract_from_html(driver.page_source, page_url)
+    finally:
+        driver.quit()
+
+
+def _scrape_from_url(page_url: str) -> dict:
+    driver = ScrapingService.load_page(page_url)
+    try:
+        headings = ExtractorService.extract_headings(driver)
+        images = ExtractorService.extract_images(driver)
+        issues = ExtractorService.extract_accessibility(driver, headings=headings, images=images)
+        text_content = ExtractorService.extract_text_content(driver)
+        metadata = ExtractorService.extract_metadata(driver)
+    finally:
+        driver.quit()
+
+    return {
+        "heading_data" : headings,
+        "images_data" : images,
+        "issues_data" : issues,
+        "text_content_data" : text_content,
+        "metadata_data" : metadata,
+    }
+
+
 @router.get("/extract-test")
 async def test_extraction(
     url: str,
@@ -36,18 +67,9 @@ async def test_extraction(
         GET /scan/scraping/extract-test?url=https://example.com
     """
     try:
-        driver = None
-
         try:
             page_url = str(url)
-            driver = ScrapingService.load_page(page_url)
-
-            # Use the unified extract_from_html method
-            # First get the HTML
-            html = driver.page_source
-            
-            # Extract all data using the standardized method
-            extracted_data = ExtractorService.extract_from_html(html, page_url)
+            extracted_data = await run_in_threadpool(_extract_from_url, page_url)
             
             return api_response(
                 message=f"Successfully extracted data from {page_url}",
@@ -59,9 +81,6 @@ async def test_extraction(
                 message=f"Extraction failed: {str(e)}",
                 data={}
             )
-        finally:
-            if driver:
-                driver.quit()
             
     except Exception as e:
         return api_response(
@@ -93,26 +112,9 @@ async def scrape_pages(
         ScrapingResponse with scraped page data
     """
     try:
-        driver = None
-
         try:
             page_url = str(url)
-            driver = ScrapingService.load_page(page_url)
-
-            # Extractor Engines
-            headings = ExtractorService.extract_headings(driver)
-            images = ExtractorService.extract_images(driver)
-            issues = ExtractorService.extract_accessibility(driver, headings=headings, images=images)
-            text_content = ExtractorService.extract_text_content(driver)
-            metadata = ExtractorService.extract_metadata(driver)
-
-            response_data = {
-                "heading_data" : headings,
-                "images_data" : images,
-                "issues_data" : issues,
-                "text_content_data" : text_content,
-                "metadata_data" : metadata,
-            }
+            response_data = await run_in_threadpool(_scrape_from_url, page_url)
             
             return api_response(data=response_data)
         except Exception as e:
@@ -121,9 +123,6 @@ async def scrape_pages(
                 message=str(e),
                 data={}
             )
-        finally:
-            if driver:
-                driver.quit()
             
     except Exception as e:
         # TODO: If job_id provided, mark scraping_status = 'failed'
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, status, Depends
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
 import logging
@@ -38,8 +39,9 @@ async def select_important_pages(
     try:
         logger.info(f"Starting page selection for job_id={data.job_id}, {len(data.pages)} pages, top_n={data.top_n}")
         
-        # Call LLM-based selection service
-        important_pages = PageSelectorService.filter_important_pages(
+        # Call LLM-based selection service (sync OpenAI client, so off the event loop)
+        important_pages = await run_in_threadpool(
+            PageSelectorService.filter_important_pages,
             data.pages,
             data.top_n,
             referer=data.referer or "https://sitemate-ai.com",
@@ -1,5 +1,5 @@
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class MetadataIssue(BaseModel):
@@ -48,8 +48,8 @@ class MetadataExtractionResult(BaseModel):
     overall_valid: bool = False
     total_issues: int = 0
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "url": "https://example.com",
                 "title": {
@@ -75,16 +75,18 @@ class MetadataExtractionResult(BaseModel):
                 "overall_valid": False,
                 "total_issues": 1
             }
-        }
+        },
+    )
 
 
 class MetadataExtractionRequest(BaseModel):
     """Request schema for metadata extraction"""
     url: str = Field(..., description="The URL to extract metadata from")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "url": "https://example.com"
             }
-        }
\ No newline at end of file
+        },
+    )
\ No newline at end of file
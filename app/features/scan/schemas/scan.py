@@ -4,7 +4,7 @@ Scan Schemas
 Request and response models for the scan API endpoints.
 """
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, HttpUrl, Field
+from pydantic import BaseModel, ConfigDict, HttpUrl, Field
 from datetime import datetime
 
 # ============================================================================
@@ -17,13 +17,14 @@ class ScanStartRequest(BaseModel):
     top_n: int = 5
     user_id: Optional[str] = None  # For authenticated users
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "url": "https://example.com",
                 "top_n": 5
             }
-        }
+        },
+    )
 
 
 class ScanStartResponse(BaseModel):
@@ -65,8 +66,7 @@ class ScanHistoryItem(BaseModel):
     score_accessibility: Optional[int] = None
     score_performance: Optional[int] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
         
     @property
     def job_id(self) -> str:
@@ -87,13 +87,14 @@ class DiscoveryRequest(BaseModel):
     url: HttpUrl
     job_id: Optional[str] = None  # Links to ScanJob if part of workflow
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "url": "https://example.com",
                 "job_id": "550e8400-e29b-41d4-a716-446655440000"
             }
-        }
+        },
+    )
 
 
 class DiscoveryResponse(BaseModel):
@@ -102,8 +103,8 @@ class DiscoveryResponse(BaseModel):
     count: int
     job_id: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "pages": [
                     "https://example.com",
@@ -113,7 +114,8 @@ class DiscoveryResponse(BaseModel):
                 "count": 3,
                 "job_id": "550e8400-e29b-41d4-a716-446655440000"
             }
-        }
+        },
+    )
 
 
 # ============================================================================
@@ -128,14 +130,15 @@ class SelectionRequest(BaseModel):
     referer: Optional[str] = None
     site_title: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "pages": ["https://example.com", "https://example.com/about"],
                 "top_n": 5,
                 "job_id": "550e8400-e29b-41d4-a716-446655440000"
             }
-        }
+        },
+    )
 
 
 class SelectionResponse(BaseModel):
@@ -144,14 +147,15 @@ class SelectionResponse(BaseModel):
     count: int
     job_id: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "important_pages": ["https://example.com", "https://example.com/about"],
                 "count": 2,
                 "job_id": "550e8400-e29b-41d4-a716-446655440000"
             }
-        }
+        },
+    )
 
 
 # ============================================================================
@@ -163,13 +167,14 @@ class ScrapingRequest(BaseModel):
     pages: List[str]
     job_id: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "pages": ["https://example.com"],
                 "job_id": "550e8400-e29b-41d4-a716-446655440000"
             }
-        }
+        },
+    )
 
 
 class ScrapingResponse(BaseModel):
@@ -189,13 +194,14 @@ class AnalysisRequest(BaseModel):
     page_ids: List[str]  # ScanPage IDs to analyze
     job_id: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "page_ids": ["page-id-1", "page-id-2"],
                 "job_id": "550e8400-e29b-41d4-a716-446655440000"
             }
-        }
+        },
+    )
 
 
 class AnalysisResponse(BaseModel):
@@ -219,9 +225,9 @@ class PageInfo(BaseModel):
     is_manually_deselected: bool
     is_selected: bool  # Computed final selection status
     
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": "page-id-123",
                 "page_url": "https://example.com/about",
@@ -230,7 +236,8 @@ class PageInfo(BaseModel):
                 "is_manually_deselected": False,
                 "is_selected": True
             }
-        }
+        },
+    )
 
 
 class GetPagesRequest(BaseModel):
@@ -254,13 +261,14 @@ class TogglePageSelectionRequest(BaseModel):
     page_id: str
     action: str  # 'select' or 'deselect'
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "page_id": "page-id-123",
                 "action": "select"
             }
-        }
+        },
+    )
 
 
 class TogglePageSelectionResponse(BaseModel):
@@ -294,7 +302,6 @@ class PeriodicScanItem(BaseModel):
     created_at: datetime
     completed_at: Optional[datetime]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
         
\ No newline at end of file
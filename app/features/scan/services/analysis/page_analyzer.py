@@ -356,7 +356,7 @@ Do not include any text before or after the JSON. Only output valid JSON."""
             )
 
             response_text = completion.choices[0].message.content or ""
-            print(f"OpenRouter Response: {response_text}")
+            logger.debug(f"OpenRouter Response: {response_text}")
 
             try:
                 result_data = json.loads(response_text)
@@ -4,6 +4,7 @@ from datetime import datetime, date
 from typing import Optional
 
 from app.features.scan.models.device_session import DeviceSession, Platform
+from app.features.scan.models.scan_job import ScanJob
 from app.platform.utils.device import hash_device_id
 from app.platform.logger import get_logger
 
@@ -129,12 +130,18 @@ async def increment_scan_count(
         db: Database session
         device_session: DeviceSession to update
     """
-    device_session.daily_scan_count += 1
-    device_session.quota_remaining -= 1
-    device_session.total_scans += 1
-    device_session.last_scan_date = datetime.utcnow()
-    
-    await db.flush()
+    # Apply the deltas in SQL so concurrent scans from the same device can't
+    # overwrite each other's counts; the loaded instance is synced in place
+    await db.execute(
+        update(DeviceSession)
+        .where(DeviceSession.id == device_session.id)
+        .values(
+            daily_scan_count=DeviceSession.daily_scan_count + 1,
+            quota_remaining=DeviceSession.quota_remaining - 1,
+            total_scans=DeviceSession.total_scans + 1,
+            last_scan_date=datetime.utcnow(),
+        )
+    )
     
     logger.info(f"Incremented scan count for device {device_session.device_hash[:8]}... "
                f"(daily={device_session.daily_scan_count}, remaining={device_session.quota_remaining})")
@@ -159,8 +166,6 @@ async def backfill_device_scans(
     Returns:
         Number of scans updated
     """
-    from app.features.scan.models.scan_job import ScanJob
-    
     # Update all scans where device_id matches and user_id is NULL
     stmt = (
         update(ScanJob)
@@ -11,6 +11,20 @@ from app.features.scan.schemas.metadata import (
 from selenium.common.exceptions import NoSuchElementException
 import re
 
+_SENTENCE_RE = re.compile(r'[.!?]+')
+
+# Body and heading text in one WebDriver round trip instead of one per element
+_TEXT_AND_HEADERS_JS = """
+return [
+    document.body ? document.body.innerText : null,
+    Array.from(document.querySelectorAll('h1, h2, h3, h4, h5, h6'), h => h.innerText)
+];
+"""
+
+# Every byte except the ASCII vowels counted as syllables; deleting these and
+# taking len() counts vowels in C instead of a per-character Python loop
+_NON_VOWEL_BYTES = bytes(b for b in range(256) if chr(b) not in "aeiouy")
+
 
 class ExtractorService:
     # SEO Best Practice Constants
@@ -360,9 +374,10 @@ class ExtractorService:
             target_keywords = []
 
         try:
-            body_element = driver.find_element(By.TAG_NAME, "body")
-            raw_text = body_element.text
+            raw_text, header_texts = driver.execute_script(_TEXT_AND_HEADERS_JS)
         except:
+            raw_text = None
+        if raw_text is None:
             return {"error": "Could not find body tag"}
         
         clean_text = " ".join(raw_text.split())
@@ -371,24 +386,24 @@ class ExtractorService:
         words = clean_text.split()
         word_count = len(words)
 
+        lower_text = clean_text.lower()
+
         # Keyword Density
         keyword_data = {}
         if target_keywords:
-            lower_text = clean_text.lower()
             for keyword in target_keywords:
                 count = lower_text.count(keyword.lower())
                 density = (count / word_count * 100) if word_count > 0 else 0
                 keyword_data[keyword] = {"count": count, "density": round(density, 2)}
 
         # Header Ratio
-        headers = driver.find_elements(By.CSS_SELECTOR, "h1, h2, h3, h4, h5, h6")
-        header_text = " ".join([h.text for h in headers])
+        header_text = " ".join(header_texts)
         header_word_count = len(header_text.split())
         hb_ratio = (header_word_count / word_count) if word_count > 0 else 0
 
         # Readability
-        sentence_count = len(re.split(r'[.!?]+', clean_text)) or 1
-        syllable_count = sum(1 for char in clean_text.lower() if char in "aeiouy")
+        sentence_count = len(_SENTENCE_RE.split(clean_text)) or 1
+        syllable_count = len(lower_text.encode("ascii", "ignore").translate(None, _NON_VOWEL_BYTES))
         
         avg_sentence_len = word_count / sentence_count
         avg_syllables_per_word = syllable_count / word_count if word_count > 0 else 0
@@ -433,7 +448,7 @@ class ExtractorService:
         # Load HTML in Selenium to use existing extraction methods
         driver = None
         try:
-            driver = ScrapingService.build_driver()
+            driver = ScrapingService.acquire_driver()
             driver.get("data:text/html;charset=utf-8," + html)
             
             # Extract all data using existing methods
@@ -493,8 +508,5 @@ class ExtractorService:
             
         finally:
             if driver:
-                try:
-                    driver.quit()
-                except:
-                    pass
+                ScrapingService.release_driver(driver)
 
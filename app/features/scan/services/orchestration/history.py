@@ -1,6 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 from typing import List
 
 from app.features.scan.models.scan_job import ScanJob as Scan
@@ -17,7 +17,8 @@ async def get_user_scan_history(user_id: str, db: AsyncSession, limit: int = 50)
         query = (
             select(Scan)
             .where(Scan.user_id == user_id)
-            .options(selectinload(Scan.site))  # Eagerly load the site relationship
+            # Many-to-one: join the site into the same SELECT rather than a second IN query
+            .options(joinedload(Scan.site))
             .order_by(desc(Scan.created_at))
             .limit(limit)
         )
@@ -1,5 +1,9 @@
+import atexit
 import os
+import queue
+import re
 import tempfile
+import httpx
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium import webdriver
@@ -10,6 +14,28 @@ from app.platform.config import settings
 
 _CHROMEDRIVER_PATH = None
 
+_USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+)
+# Shared keep-alive pool for static fetches, reused across Celery tasks in a worker
+_http_client = httpx.Client(
+    headers={"User-Agent": _USER_AGENT},
+    follow_redirects=True,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+)
+
+# Per-process pool of warm Chrome instances; a Celery child keeps its drivers
+# between tasks instead of paying the browser cold start on every scrape
+_DRIVER_POOL_SIZE = 3
+_driver_pool: "queue.LifoQueue[webdriver.Chrome]" = queue.LifoQueue(maxsize=_DRIVER_POOL_SIZE)
+
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_NON_VISIBLE_RE = re.compile(r"<(script|style|noscript|template)\b.*?</\1>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+# Below this much visible text the page is most likely rendered client-side
+_MIN_STATIC_TEXT_CHARS = 200
+
 
 class ScrapingService:
     @staticmethod
@@ -28,6 +54,51 @@ class ScrapingService:
         return driver
 
 
+    @staticmethod
+    def acquire_driver() -> webdriver.Chrome:
+        """
+        Lease a driver from the pool, building a new one if none is idle.
+        Return it with release_driver() instead of calling driver.quit().
+        """
+        while True:
+            try:
+                driver = _driver_pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                driver.execute_script("return 1")
+                return driver
+            except WebDriverException:
+                ScrapingService._quit_driver(driver)
+
+        return ScrapingService.build_driver()
+
+    @staticmethod
+    def release_driver(driver: webdriver.Chrome) -> None:
+        """
+        Reset a leased driver and put it back, or quit it if the pool is full
+        or the reset fails, so no site state leaks into the next scan.
+        """
+        try:
+            # delete_all_cookies() only covers the current document's domain
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            origin = driver.execute_script("return window.location.origin")
+            if origin and origin != "null":
+                driver.execute_cdp_cmd(
+                    "Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"}
+                )
+            driver.get("about:blank")
+            _driver_pool.put_nowait(driver)
+        except (queue.Full, WebDriverException):
+            ScrapingService._quit_driver(driver)
+
+    @staticmethod
+    def _quit_driver(driver: webdriver.Chrome) -> None:
+        try:
+            driver.quit()
+        except Exception:
+            pass  # Ignore cleanup errors
+
     @staticmethod
     def load_page(url: str, timeout: int = 10) -> webdriver.Chrome:
         """
@@ -45,21 +116,67 @@ class ScrapingService:
     
     
     @staticmethod
-    def scrape_page(url: str, timeout: int = 5) -> Dict[str, Any]:
+    def fetch_static(url: str, timeout: int = 5) -> dict[str, Any] | None:
+        """
+        Fetch a page over plain HTTP without starting a browser.
+
+        Returns the same shape as scrape_page, or None when the page isn't
+        usable without JavaScript (non-HTML, error status, or an empty
+        client-rendered shell) so the caller can fall back to Selenium.
+        """
+        try:
+            response = _http_client.get(url, timeout=timeout)
+        except (httpx.HTTPError, httpx.InvalidURL, ValueError):
+            # ValueError covers UnicodeError from malformed hosts
+            return None
+
+        if response.status_code >= 400:
+            return None
+        if "html" not in response.headers.get("content-type", ""):
+            return None
+
+        html_content = response.text
+        visible_text = _TAG_RE.sub(" ", _NON_VISIBLE_RE.sub(" ", html_content))
+        if len("".join(visible_text.split())) < _MIN_STATIC_TEXT_CHARS:
+            return None
+
+        title_match = _TITLE_RE.search(html_content)
+        page_title = title_match.group(1).strip() if title_match else None
+        return {
+            "url": url,
+            "current_url": str(response.url),
+            "html": html_content,
+            "page_title": page_title or None,
+            "content_length": len(html_content),
+            "success": True
+        }
+
+    @staticmethod
+    def scrape_page(url: str, timeout: int = 5, needs_js: bool = False) -> Dict[str, Any]:
         """
         Scrape a page and return serializable data (for Celery tasks).
-        Driver is automatically closed after scraping.
+        Tries a plain HTTP fetch first and only uses Chrome when the page
+        needs JavaScript (or needs_js is set). The driver is leased from the
+        per-process pool and returned after scraping.
         
         Args:
             url: URL to scrape
             timeout: Page load timeout in seconds
+            needs_js: Skip the static fetch and always render with Selenium
             
         Returns:
             Dict with HTML content and metadata (fully serializable)
         """
+        if not needs_js:
+            static_result = ScrapingService.fetch_static(url, timeout)
+            if static_result:
+                return static_result
+
         driver = None
         try:
-            driver = ScrapingService.load_page(url, timeout)
+            driver = ScrapingService.acquire_driver()
+            driver.set_page_load_timeout(timeout)
+            driver.get(url)
             
             # Extract all data we need
             html_content = driver.page_source
@@ -101,7 +218,15 @@ class ScrapingService:
             }
         finally:
             if driver:
-                try:
-                    driver.quit()
-                except:
-                    pass  # Ignore cleanup errors
\ No newline at end of file
+                ScrapingService.release_driver(driver)
+
+
+def _drain_driver_pool() -> None:
+    while True:
+        try:
+            ScrapingService._quit_driver(_driver_pool.get_nowait())
+        except queue.Empty:
+            return
+
+
+atexit.register(_drain_driver_pool)
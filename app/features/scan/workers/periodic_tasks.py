@@ -4,7 +4,7 @@ Celery periodic tasks for automated site scanning.
 This module contains tasks that run on a schedule via Celery Beat.
 """
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from celery import shared_task
 
 from app.platform.celery_app import celery_app
@@ -28,10 +28,11 @@ def check_and_trigger_periodic_scans(self):
     3. Sends email report after scan completes
     """
     from app.features.scan.workers.tasks import get_sync_db
-    from app.features.sites.models.site import Site, ScanFrequency
+    from app.features.sites.models.site import SCAN_FREQUENCY_INTERVALS, Site, ScanFrequency
     from app.features.scan.workers.tasks import run_scan_pipeline
     from sqlalchemy import select
-    from app.features.auth.models.user import User
+    from sqlalchemy.orm import joinedload
+    from app.features.auth.models.user import User  # noqa: F401  (registers the Site.user mapper target)
     
     logger.info("Checking for sites due for periodic scanning...")
     
@@ -41,10 +42,15 @@ def check_and_trigger_periodic_scans(self):
         # Query sites that need scanning (check by date, not datetime)
         from datetime import date
         today = date.today()
-        query = select(Site).where(
-            Site.scan_frequency_enabled == True,
-            Site.next_scheduled_scan <= today,
-            Site.scan_frequency != ScanFrequency.disabled
+        # Eagerly load the owner so we don't issue one User query per site
+        query = (
+            select(Site)
+            .options(joinedload(Site.user))
+            .where(
+                Site.scan_frequency_enabled == True,
+                Site.next_scheduled_scan <= today,
+                Site.scan_frequency != ScanFrequency.disabled
+            )
         )
         
         result = db.execute(query)
@@ -73,12 +79,9 @@ def check_and_trigger_periodic_scans(self):
                 db.flush()  # Get the job ID
                 
                 # Update next_scheduled_scan based on frequency (use date arithmetic)
-                if site.scan_frequency == ScanFrequency.weekly:
-                    site.next_scheduled_scan = today + timedelta(days=7)
-                elif site.scan_frequency == ScanFrequency.monthly:
-                    site.next_scheduled_scan = today + timedelta(days=30)
-                elif site.scan_frequency == ScanFrequency.quarterly:
-                    site.next_scheduled_scan = today + timedelta(days=90)
+                interval = SCAN_FREQUENCY_INTERVALS.get(site.scan_frequency)
+                if interval:
+                    site.next_scheduled_scan = today + interval
                 
                 site.last_periodic_scan_at = today
                 
@@ -90,14 +93,9 @@ def check_and_trigger_periodic_scans(self):
                 # Get user email and name for notification
                 user_email = None
                 user_name = None
-                if site.user_id:
-                    # We need to fetch the user to get their email
-                    # Since we can't easily do a join here with the current setup, 
-                    # let's fetch the user separately
-                    user = db.query(User).filter(User.id == site.user_id).first()
-                    if user:
-                        user_email = user.email
-                        user_name = user.first_name
+                if site.user:
+                    user_email = site.user.email
+                    user_name = site.user.first_name
                 
                 task_result = run_scan_pipeline.delay(
                     job_id=str(scan_job.id),
@@ -4,6 +4,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 from celery import shared_task, chain, group, chord
 from celery.exceptions import Retry
+from sqlalchemy import insert, update
 from app.features.scan.models.scan_job import ScanJob, ScanJobStatus
 from app.platform.celery_app import celery_app
 from app.features.auth.models.user import User 
@@ -27,6 +28,7 @@ def get_sync_db():
         from sqlalchemy import create_engine
         from sqlalchemy.orm import sessionmaker
         from app.platform.config import settings
+        from app.platform.db.session import pool_options
 
         db_url = settings.DATABASE_URL
         if db_url.startswith("postgresql+asyncpg://"):
@@ -34,11 +36,7 @@ def get_sync_db():
 
         _sync_engine = create_engine(
             db_url,
-            pool_size=25,
-            max_overflow=25, 
-            pool_timeout=30, 
-            pool_pre_ping=True,
-            pool_recycle=3600,
+            **pool_options(pool_size=25, max_overflow=25, pool_recycle=3600),
         )
         _sync_session_factory = sessionmaker(autocommit=False, autoflush=False, bind=_sync_engine)
     
@@ -457,17 +455,22 @@ def _save_discovered_pages(job_id: str, pages: List[str]):
                 else:
                     raise Exception(f"Job {job_id} does not exist after {max_retries} retries")
             
-            # Job exists, now insert pages
-            for page_url in pages:
-                page = ScanPage(
-                    scan_job_id=job_id,
-                    page_url=page_url,
-                    page_url_normalized=page_url.rstrip('/'),
-                    is_selected_by_llm=False,
-                    is_manually_selected=False,
-                    is_manually_deselected=False
+            # Job exists, now insert pages as one multi-row INSERT
+            if pages:
+                db.execute(
+                    insert(ScanPage),
+                    [
+                        {
+                            "scan_job_id": job_id,
+                            "page_url": page_url,
+                            "page_url_normalized": page_url.rstrip('/'),
+                            "is_selected_by_llm": False,
+                            "is_manually_selected": False,
+                            "is_manually_deselected": False,
+                        }
+                        for page_url in pages
+                    ],
                 )
-                db.add(page)
             
             db.commit()
             logger.info(f"Successfully saved {len(pages)} pages for job {job_id}")
@@ -591,11 +594,18 @@ def _mark_selected_pages(job_id: str, selected_urls: List[str]):
     db = get_sync_db()
     try:
         selected_normalized = {url.rstrip('/') for url in selected_urls}
-        pages = db.query(ScanPage).filter(ScanPage.scan_job_id == job_id).all()
-
-        for page in pages:
-            if page.page_url_normalized in selected_normalized:
-                page.is_selected_by_llm = True
+        # One UPDATE instead of loading every page of the job and flushing
+        # a row-by-row UPDATE for each match
+        if selected_normalized:
+            db.execute(
+                update(ScanPage)
+                .where(
+                    ScanPage.scan_job_id == job_id,
+                    ScanPage.page_url_normalized.in_(selected_normalized),
+                )
+                .values(is_selected_by_llm=True)
+                .execution_options(synchronize_session=False)
+            )
 
         db.commit()
         def verify_pages_marked():
@@ -951,105 +961,97 @@ def _map_icon_to_severity(icon: str) -> str:
         return "low"
 
 
-def _create_scan_issues(
+def _add_scan_issues(
+    db,
     page_id: str,
     job_id: str,
     detailed_analysis: Dict[str, Any]
-) -> int:
+) -> tuple[int, int]:
     """
-    Extract problems from detailed_analysis and create ScanIssue records.
+    Extract problems from detailed_analysis and insert ScanIssue records
+    in the caller's transaction. The caller commits.
 
     Args:
+        db: Session whose transaction the issues are written in
         page_id: Database ID of the scanned page
         job_id: Database ID of the scan job
         detailed_analysis: Full structured analysis result from LLM
 
     Returns:
-        Number of issues created
+        (number of issues created, number of high-severity issues)
     """
-    from app.features.scan.models.scan_issue import ScanIssue, IssueCategory, IssueSeverity
-    from app.features.scan.models.scan_job import ScanJob
-    
-    db = get_sync_db()
-    issues_created = 0
+    from app.features.scan.models.scan_issue import ScanIssue, IssueCategory
+
+    issue_rows: List[Dict[str, Any]] = []
     critical_count = 0  # Track high/critical severity issues
-    
-    try:
-        # Extract problems from each category
-        categories_map = {
-            # accessibility problems map to accessibility
-            "accessibility": IssueCategory.accessibility,
-            "performance": IssueCategory.performance,
-            "seo": IssueCategory.seo,
-        }
 
-        for section_key, issue_category in categories_map.items():
-            problems = detailed_analysis.get(section_key + '_issues', [])
+    # Extract problems from each category
+    categories_map = {
+        # accessibility problems map to accessibility
+        "accessibility": IssueCategory.accessibility,
+        "performance": IssueCategory.performance,
+        "seo": IssueCategory.seo,
+    }
 
-            for problem in problems:
-                try:
-                    title = problem.get("title", "")
-                    description = problem.get("description", title)
-
-                    # Skip if no title
-                    if not title:
-                        logger.warning(
-                            f"Skipping problem with no title in {section_key} section")
-                        continue
-
-                    # Map icon to severity
-                    severity_str = problem.get('severity')
-                    
-                    # Track critical/high issues
-                    if severity_str in ["high"]:
-                        critical_count += 1
-                    
-                    # Create ScanIssue record
-                    issue = ScanIssue(
-                        scan_page_id=page_id,
-                        scan_job_id=job_id,
-                        category=issue_category,
-                        severity=severity_str,
-                        title=title[:512],  # Truncate to column limit
-                        description=description,
-                        recommendation=problem.get('recommendation', ''),
-                        business_impact=problem.get('business_impact', '')
-                    )
+    for section_key, issue_category in categories_map.items():
+        problems = detailed_analysis.get(section_key + '_issues', [])
 
-                    db.add(issue)
-                    issues_created += 1
+        for problem in problems:
+            try:
+                title = problem.get("title", "")
+                description = problem.get("description", title)
 
-                except Exception as e:
-                    logger.error(
-                        f"Failed to create issue from problem: {e}", exc_info=True)
+                # Skip if no title
+                if not title:
+                    logger.warning(
+                        f"Skipping problem with no title in {section_key} section")
                     continue
 
-        # Commit all issues at once
-        db.commit()
-        logger.info(f"Created {issues_created} ScanIssue records for page {page_id} ({critical_count} critical/high)")
-        
-        # NEW: Trigger critical issues notification if any high-severity issues found
-        if critical_count > 0:
-            # Get job to find user_id
-            job = db.query(ScanJob).filter(ScanJob.id == job_id).first()
-            if job:
-                send_scan_notification(
-                    user_id=str(job.user_id),
-                    title=f"⚠️ {critical_count} Critical Issue{'s' if critical_count > 1 else ''} Detected",
-                    message=f"Your scan found {critical_count} critical issue{'s' if critical_count > 1 else ''} that need immediate attention.",
-                    notification_type="issue_detected",
-                    priority="urgent",
-                    action_url=f"/scans/{job_id}/issues"
-                )
-        
-    except Exception as e:
-        logger.error(f"Failed to create scan issues: {e}", exc_info=True)
-        db.rollback()
-        raise
-    finally:
-        db.close()
+                # Map icon to severity
+                severity_str = problem.get('severity')
+                
+                # Track critical/high issues
+                if severity_str in ["high"]:
+                    critical_count += 1
+                
+                # Collect the ScanIssue row; all rows go in one INSERT below
+                issue_rows.append({
+                    "scan_page_id": page_id,
+                    "scan_job_id": job_id,
+                    "category": issue_category,
+                    "severity": severity_str,
+                    "title": title[:512],  # Truncate to column limit
+                    "description": description,
+                    "recommendation": problem.get('recommendation', ''),
+                    "business_impact": problem.get('business_impact', ''),
+                })
+
+            except Exception as e:
+                logger.error(
+                    f"Failed to create issue from problem: {e}", exc_info=True)
+                continue
 
-    return issues_created
+    if issue_rows:
+        db.execute(insert(ScanIssue), issue_rows)
+
+    return len(issue_rows), critical_count
+
+
+def _notify_critical_issues(db, job_id: str, critical_count: int) -> None:
+    """Tell the scan owner about high-severity issues found on a page."""
+    from app.features.scan.models.scan_job import ScanJob
+
+    # Get job to find user_id
+    job = db.query(ScanJob).filter(ScanJob.id == job_id).first()
+    if job:
+        send_scan_notification(
+            user_id=str(job.user_id),
+            title=f"⚠️ {critical_count} Critical Issue{'s' if critical_count > 1 else ''} Detected",
+            message=f"Your scan found {critical_count} critical issue{'s' if critical_count > 1 else ''} that need immediate attention.",
+            notification_type="issue_detected",
+            priority="urgent",
+            action_url=f"/scans/{job_id}/issues"
+        )
 
 
 def _update_page_analysis(
@@ -1093,6 +1095,20 @@ def _update_page_analysis(
                     f"Page model missing 'analysis_details' column - detailed analysis not saved")
 
             page.scanned_at = datetime.utcnow()
+            job_id = page.scan_job_id
+
+            # Issues are written in the same transaction as the scores; the
+            # savepoint keeps a bad issue batch from losing the page update
+            issues_count, critical_count = 0, 0
+            try:
+                with db.begin_nested():
+                    issues_count, critical_count = _add_scan_issues(
+                        db, page_id, job_id, detailed_analysis)
+            except Exception as e:
+                logger.error(
+                    f"Failed to create scan issues for page {page_id}: {e}", exc_info=True)
+                # Don't fail the whole analysis if issue creation fails
+
             db.commit()
 
             def verify_analysis_saved():
@@ -1121,19 +1137,12 @@ def _update_page_analysis(
             
 
             logger.info(f"Updated page {page_id} with analysis scores")
+            logger.info(
+                f"Created {issues_count} issues for page {page_id} ({critical_count} critical/high)")
 
-            # Create individual ScanIssue records from problems in detailed_analysis
-            try:
-                # Get job_id from the page object
-                job_id = page.scan_job_id
-                issues_count = _create_scan_issues(
-                    page_id, job_id, detailed_analysis)
-                logger.info(
-                    f"Created {issues_count} issues for page {page_id}")
-            except Exception as e:
-                logger.error(
-                    f"Failed to create scan issues for page {page_id}: {e}", exc_info=True)
-                # Don't fail the whole analysis if issue creation fails
+            # Trigger critical issues notification if any high-severity issues found
+            if critical_count > 0:
+                _notify_critical_issues(db, job_id, critical_count)
         else:
             logger.warning(f"Page {page_id} not found in database")
 
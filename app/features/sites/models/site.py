@@ -2,6 +2,7 @@ from sqlalchemy import Column, String, Integer, ForeignKey, Enum, DateTime, Date
 from sqlalchemy.orm import relationship
 from app.platform.db.base import BaseModel
 import enum
+from datetime import timedelta
 
 
 class SiteStatus(enum.Enum):
@@ -18,6 +19,14 @@ class ScanFrequency(enum.Enum):
     quarterly = "quarterly"  # Every 90 days
 
 
+# Gap until the next periodic scan; ScanFrequency.disabled has no entry
+SCAN_FREQUENCY_INTERVALS = {
+    ScanFrequency.weekly: timedelta(days=7),
+    ScanFrequency.monthly: timedelta(days=30),
+    ScanFrequency.quarterly: timedelta(days=90),
+}
+
+
 class Site(BaseModel):
     """
     Site model with flexible ownership — user_id takes priority over device_id.
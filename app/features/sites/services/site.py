@@ -1,4 +1,5 @@
 import re
+from datetime import date
 
 from fastapi import HTTPException, status
 from sqlalchemy import update
@@ -6,38 +7,62 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from app.features.sites.models.site import Site, SiteStatus
+from app.features.sites.models.site import SCAN_FREQUENCY_INTERVALS, ScanFrequency, Site, SiteStatus
 from app.features.sites.schemas.site import SiteCreate
+from app.platform.utils.url_validator import canonicalize_url
+
+
+_SCHEME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*://")
+_SCHEME_HOST_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*://(?P<hostname>[^/:]+)")
+_BARE_HOST_RE = re.compile(r"^(?P<hostname>[^/:]+)")
 
 
 def normalize_url(url: str) -> str:
     url = url.strip()
     if url.startswith("//"):
         return "http:" + url
-    if not re.match(r"^[a-zA-Z][a-zA-Z0-9+.-]*://", url):
+    if not _SCHEME_RE.match(url):
         return "http://" + url
     return url
 
 
 def is_valid_domain(url: str) -> bool:
-    match = re.search(r"^[a-zA-Z][a-zA-Z0-9+.-]*://(?P<hostname>[^/:]+)", url)
+    match = _SCHEME_HOST_RE.match(url)
     if not match:
-        match = re.search(r"^(?P<hostname>[^/:]+)", url)
+        match = _BARE_HOST_RE.match(url)
         if not match:
             return False
     hostname = match.group("hostname")
     return "." in hostname and not hostname.startswith(".") and not hostname.endswith(".")
 
 
+def _root_url_filter(root_url: str, legacy_url: str):
+    """
+    Match a site by its canonical root_url, or by the raw form rows were
+    stored under before URLs were canonicalized.
+    """
+    return Site.root_url.in_({root_url, legacy_url})
+
+
 async def create_site(
     db: AsyncSession,
     site_data: SiteCreate,
     user_id: str | None = None,
     device_id: str | None = None,
 ):
-    normalized_url = normalize_url(site_data.root_url)
+    legacy_url = normalize_url(site_data.root_url)
+    normalized_url = canonicalize_url(legacy_url)
     payload_device_id = getattr(site_data, "device_id", None)
 
+    # The unique constraint only sees the canonical form; catch older rows too
+    existing = select(Site.id).where(_root_url_filter(normalized_url, legacy_url))
+    if user_id:
+        existing = existing.where(Site.user_id == user_id)
+    else:
+        existing = existing.where(Site.device_id == (device_id or payload_device_id))
+    if (await db.execute(existing.limit(1))).first():
+        raise ValueError("You already have a site with this root_url")
+
     new_site = Site(
         user_id=user_id,
         device_id=device_id or payload_device_id,
@@ -59,6 +84,45 @@ async def create_site(
     return new_site
 
 
+async def get_or_create_site(
+    db: AsyncSession,
+    url: str,
+    user_id: str | None = None,
+    device_id: str | None = None,
+) -> Site:
+    """
+    Get the owner's site for a URL, creating it if needed.
+    The new site is flushed but not committed; the caller owns the transaction.
+    """
+    root_url = canonicalize_url(url)
+    # Prefer the canonical row if an older, non-canonical one also exists
+    query = (
+        select(Site)
+        .where(_root_url_filter(root_url, url))
+        .order_by((Site.root_url == root_url).desc())
+        .limit(1)
+    )
+    if user_id:
+        query = query.where(Site.user_id == user_id)
+    else:
+        query = query.where(Site.device_id == device_id)
+
+    result = await db.execute(query)
+    site = result.scalars().first()
+    if site:
+        return site
+
+    site = Site(user_id=user_id, device_id=device_id, root_url=root_url, total_scans=0)
+    try:
+        async with db.begin_nested():
+            db.add(site)
+    except IntegrityError:
+        # Another request created it between our SELECT and INSERT
+        result = await db.execute(query)
+        site = result.scalars().first()
+    return site
+
+
 async def get_sites_for_owner(
     db: AsyncSession,
     user_id: str | None = None,
@@ -134,6 +198,15 @@ async def soft_delete_site_by_id_for_owner(
     return site
 
 
+def calculate_next_scheduled_scan(scan_frequency, scan_frequency_enabled: bool):
+    """Calculate the next scheduled scan date based on frequency"""
+    if not scan_frequency_enabled or scan_frequency == ScanFrequency.disabled:
+        return None
+
+    interval = SCAN_FREQUENCY_INTERVALS.get(scan_frequency)
+    return date.today() + interval if interval else None
+
+
 async def update_site_scan_frequency(
     db: AsyncSession,
     site_id: str,
@@ -143,36 +216,53 @@ async def update_site_scan_frequency(
     device_id: str | None = None,
 ):
     """Update periodic scan frequency settings for a site"""
-    from datetime import datetime, timedelta
-    from app.features.sites.models.site import ScanFrequency
-    
-    # Get the site first to verify ownership
-    site = await get_site_by_id_for_owner(
-        db=db,
-        site_id=site_id,
-        user_id=user_id,
-        device_id=device_id
+    # Ownership check and update in one statement
+    stmt = (
+        update(Site)
+        .where(Site.id == site_id, Site.status != SiteStatus.deleted)
+        .values(
+            scan_frequency=scan_frequency,
+            scan_frequency_enabled=scan_frequency_enabled,
+            next_scheduled_scan=calculate_next_scheduled_scan(scan_frequency, scan_frequency_enabled),
+        )
+        .returning(Site)
     )
-    
-    # Calculate next scheduled scan date based on frequency
-    next_scheduled_scan = None
-    if scan_frequency_enabled and scan_frequency != ScanFrequency.disabled:
-        from datetime import date
-        today = date.today()
-        if scan_frequency == ScanFrequency.weekly:
-            next_scheduled_scan = today + timedelta(days=7)
-        elif scan_frequency == ScanFrequency.monthly:
-            next_scheduled_scan = today + timedelta(days=30)
-        elif scan_frequency == ScanFrequency.quarterly:
-            next_scheduled_scan = today + timedelta(days=90)
 
-    
-    # Update the site
-    site.scan_frequency = scan_frequency
-    site.scan_frequency_enabled = scan_frequency_enabled
-    site.next_scheduled_scan = next_scheduled_scan
-    
+    if user_id:
+        stmt = stmt.where(Site.user_id == user_id)
+    elif device_id:
+        stmt = stmt.where(Site.device_id == device_id)
+    else:
+        raise HTTPException(status_code=400, detail="No ownership context provided")
+
+    result = await db.execute(stmt)
+    site = result.scalars().first()
+    if not site:
+        raise HTTPException(status_code=404, detail="Site not found")
     await db.commit()
-    await db.refresh(site)
     return site
 
+
+async def update_scan_frequency_for_owner(
+    db: AsyncSession,
+    scan_frequency,
+    scan_frequency_enabled: bool,
+    user_id: str,
+):
+    """Update periodic scan frequency settings for all of a user's sites in one statement"""
+    stmt = (
+        update(Site)
+        .where(Site.user_id == user_id, Site.status != SiteStatus.deleted)
+        .values(
+            scan_frequency=scan_frequency,
+            scan_frequency_enabled=scan_frequency_enabled,
+            next_scheduled_scan=calculate_next_scheduled_scan(scan_frequency, scan_frequency_enabled),
+        )
+        .returning(Site)
+    )
+
+    result = await db.execute(stmt)
+    sites = result.scalars().all()
+    await db.commit()
+    return sites
+
@@ -1,3 +1,4 @@
+import time
 from datetime import datetime, timezone
 from enum import Enum
 from sqlalchemy import Enum as SQLEnum
@@ -30,13 +31,23 @@ class TicketCategory(str, Enum):
     GENERAL = "general"
 
 
+# (UTC day number, "YYYYMMDD") - the date part only changes once a day
+_ticket_date_cache = (-1, "")
+
+
 def make_ticket_id() -> str:
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d")
-    return f"TKT-{timestamp}-{str(uuid7()).upper()}"
+    global _ticket_date_cache
+    day = int(time.time() // 86400)
+    if _ticket_date_cache[0] != day:
+        _ticket_date_cache = (day, datetime.fromtimestamp(day * 86400, timezone.utc).strftime("%Y%m%d"))
+    return f"TKT-{_ticket_date_cache[1]}-{str(uuid7()).upper()}"
 
 
 class SupportTicket(BaseModel):
     __tablename__ = "support_tickets"
+    # Fetch server-generated created_at/updated_at via INSERT ... RETURNING
+    # so create_ticket doesn't need a follow-up SELECT to refresh them
+    __mapper_args__ = {"eager_defaults": True}
     ticket_id = Column(
             String(50), 
             unique=True, 
@@ -51,12 +62,12 @@ class SupportTicket(BaseModel):
     subject = Column(String(500), nullable=False)
     message = Column(Text, nullable=False)
     priority = Column(
-        SQLEnum(TicketPriority), 
+        SQLEnum(TicketPriority, name="ticketpriority"),
         nullable=False, 
         default=TicketPriority.MEDIUM
     )
     status = Column(
-        SQLEnum(TicketStatus), 
+        SQLEnum(TicketStatus, name="ticketstatus"),
         nullable=False, 
         default=TicketStatus.PENDING, 
         index=True
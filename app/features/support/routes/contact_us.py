@@ -49,7 +49,7 @@ async def contact_us(
         page=request.page,
     )
 
-    background_tasks.add_task(TicketService.send_ticket_notification, ticket)
+    await TicketService.enqueue_ticket_notification(ticket, background_tasks)
 
     return api_response(
         message="Thank you for contacting us. We'll get back to you soon!",
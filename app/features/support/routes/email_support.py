@@ -1,20 +1,61 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Annotated
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Path, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.features.notifications.models.notifications import (
+    NotificationPriority,
+    NotificationType,
+)
+from app.features.notifications.services.notifications import NotificationService
+from app.features.support.models.support_ticket import TicketStatus
 from app.features.support.schemas.support_request import (
     EmailSupportRequest,
+    TicketId,
     TicketResponse,
     TicketStatusUpdate,
 )
 from app.features.support.services.email_service import TicketService
-from app.platform.db.session import get_db
+from app.platform.db.session import SessionLocal, get_db
 from app.platform.response import api_response
 
-from app.platform.services.email import send_email
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+router = APIRouter(prefix="/support/email", tags=["Email Support"])
 
+# Malformed ids get a 422 from request validation instead of a DB lookup
+TicketIdPath = Annotated[TicketId, Path(description="Public ticket id (TKT-...)")]
 
-router = APIRouter(prefix="/support/email", tags=["Email Support"])
+_STATUS_MESSAGES: dict[TicketStatus, str] = {
+    TicketStatus.IN_PROGRESS: "Your support ticket is being reviewed by our team",
+    TicketStatus.RESOLVED: "Your support ticket has been resolved! Check the ticket for details.",
+    TicketStatus.CLOSED: "Your support ticket has been closed",
+}
+
+
+def _ticket_response(ticket) -> TicketResponse:
+    """
+    Build the response from a SupportTicket row without re-validating it;
+    the values come straight from our own columns.
+    """
+    return TicketResponse.model_construct(
+        **{name: getattr(ticket, name) for name in TicketResponse.model_fields}
+    )
+
+
+async def _notify_user(user_id: str, title: str, message: str, action_url: str) -> None:
+    """
+    Create an in-app notification after the response has been sent.
+    Runs as a background task, so it opens its own session; the request's
+    session is closed by then.
+    """
+    async with SessionLocal() as db:
+        await NotificationService(db).create_notification(
+            user_id=user_id,
+            title=title,
+            message=message,
+            notification_type=NotificationType.SUPPORT_RESPONSE,
+            priority=NotificationPriority.MEDIUM,
+            action_url=action_url,
+        )
 
 
 @router.post("/",  status_code=status.HTTP_201_CREATED)
@@ -40,32 +81,27 @@ async def create_support_ticket(
         source=request.source,
     )
 
-    background_tasks.add_task(TicketService.send_ticket_notification, ticket)
+    await TicketService.enqueue_ticket_notification(ticket, background_tasks)
 
     # NEW: Send notification to user (if authenticated)
     if hasattr(ticket, 'user_id') and ticket.user_id:
-        from app.features.notifications.services.notifications import NotificationService
-        from app.features.notifications.models.notifications import NotificationType, NotificationPriority
-        
-        notification_service = NotificationService(db)
-        await notification_service.create_notification(
-            user_id=str(ticket.user_id),
-            title="Support Ticket Created",
-            message=f"We received your support request: {request.subject}. Our team will respond soon.",
-            notification_type=NotificationType.SUPPORT_RESPONSE,
-            priority=NotificationPriority.MEDIUM,
-            action_url=f"/support/tickets/{ticket.id}"
+        background_tasks.add_task(
+            _notify_user,
+            str(ticket.user_id),
+            "Support Ticket Created",
+            f"We received your support request: {request.subject}. Our team will respond soon.",
+            f"/support/tickets/{ticket.id}",
         )
    
     return api_response(
         message="Support ticket created successfully", 
-        data=TicketResponse.model_validate(ticket),
+        data=_ticket_response(ticket),
         status_code=status.HTTP_201_CREATED,
     )
 
 
 @router.get("/{ticket_id}")
-async def get_ticket(ticket_id: str, db: AsyncSession = Depends(get_db)):
+async def get_ticket(ticket_id: TicketIdPath, db: AsyncSession = Depends(get_db)):
     """Get ticket details by ticket ID"""
 
     ticket_service = TicketService(db)
@@ -73,13 +109,14 @@ async def get_ticket(ticket_id: str, db: AsyncSession = Depends(get_db)):
     if not ticket:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ticket not found")
 
-    return api_response(data=TicketResponse.model_validate(ticket))
+    return api_response(data=_ticket_response(ticket))
 
 
 @router.patch("/{ticket_id}", status_code=status.HTTP_200_OK)
 async def update_ticket_status(
-    ticket_id: str, 
+    ticket_id: TicketIdPath, 
     status_update: TicketStatusUpdate, 
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """Update ticket status"""
@@ -91,32 +128,21 @@ async def update_ticket_status(
 
     # NEW: Notify user of status change
     if hasattr(updated_ticket, 'user_id') and updated_ticket.user_id:
-        from app.features.notifications.services.notifications import NotificationService
-        from app.features.notifications.models.notifications import NotificationType, NotificationPriority
-        
-        status_messages = {
-            "IN_PROGRESS": "Your support ticket is being reviewed by our team",
-            "RESOLVED": "Your support ticket has been resolved! Check the ticket for details.",
-            "CLOSED": "Your support ticket has been closed"
-        }
-        
-        message = status_messages.get(
+        message = _STATUS_MESSAGES.get(
             status_update.status, 
-            f"Your ticket status changed to {status_update.status}"
+            f"Your ticket status changed to {status_update.status.value}"
         )
         
-        notification_service = NotificationService(db)
-        await notification_service.create_notification(
-            user_id=str(updated_ticket.user_id),
-            title="Support Ticket Updated",
-            message=message,
-            notification_type=NotificationType.SUPPORT_RESPONSE,
-            priority=NotificationPriority.MEDIUM,
-            action_url=f"/support/tickets/{ticket_id}"
+        background_tasks.add_task(
+            _notify_user,
+            str(updated_ticket.user_id),
+            "Support Ticket Updated",
+            message,
+            f"/support/tickets/{ticket_id}",
         )
 
     return api_response(
-        data=TicketResponse.model_validate(updated_ticket),
+        data=_ticket_response(updated_ticket),
         message="Ticket status updated successfully",
         status_code=status.HTTP_200_OK,
     )
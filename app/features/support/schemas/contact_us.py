@@ -1,11 +1,18 @@
 import re
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
+
+from app.features.support.schemas.support_request import FullName
+
+_PHONE_CHARS_RE = re.compile(r'^[\d\s\+\-\(\)]+$')
+_NON_DIGIT_RE = re.compile(r'[^\d]')
 
 
 class ContactUsRequest(BaseModel):
-    full_name: str = Field(..., min_length=2, max_length=255)
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
+    full_name: FullName
     phone_number: Optional[str] = Field(None, min_length=7, max_length=20)
     email: EmailStr = Field(...)
     message: str = Field(..., min_length=10, max_length=5000)
@@ -18,19 +25,16 @@ class ContactUsRequest(BaseModel):
         if value is None:
             return value
         
-        # Remove whitespace for validation
-        cleaned = value.strip()
-        
         # Check if phone number contains only digits, spaces, +, -, and parentheses (NO ALPHABETS)
-        if not re.match(r'^[\d\s\+\-\(\)]+$', cleaned):
+        if not _PHONE_CHARS_RE.match(value):
             raise ValueError("Phone number can only contain digits, spaces, +, -, and parentheses. No alphabetic characters allowed.")
         
         # Extract only digits to validate length
-        digits_only = re.sub(r'[^\d]', '', cleaned)
+        digits_only = _NON_DIGIT_RE.sub('', value)
         if len(digits_only) < 7:
             raise ValueError("Phone number must contain at least 7 digits")
         
         if len(digits_only) > 15:
             raise ValueError("Phone number cannot exceed 15 digits")
         
-        return cleaned
\ No newline at end of file
+        return value
\ No newline at end of file
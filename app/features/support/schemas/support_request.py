@@ -1,5 +1,7 @@
 from datetime import datetime
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, StringConstraints
 
 from app.features.support.models.support_ticket import (
     TicketStatus,
@@ -7,23 +9,35 @@ from app.features.support.models.support_ticket import (
     TicketCategory,
 )
 
+# make_ticket_id(): TKT-<YYYYMMDD>-<upper-case UUIDv7>
+TICKET_ID_PATTERN = r"^TKT-\d{8}-[0-9A-F]{8}-[0-9A-F]{4}-[0-9A-F]{4}-[0-9A-F]{4}-[0-9A-F]{12}$"
+
+TicketId = Annotated[str, StringConstraints(pattern=TICKET_ID_PATTERN, max_length=50)]
+
+TicketSource = Literal["mobile", "web", "api"]
+
+FullName = Annotated[str, StringConstraints(strip_whitespace=True, min_length=2, max_length=255)]
+
+
 class EmailSupportRequest(BaseModel):
     """Schema for email support request"""
 
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     # name: str = Field(..., min_length=2, max_length=255, description="User's full name")
     email: EmailStr = Field(..., description="User's email address")
-    full_name: str | None = Field(None, min_length=2, max_length=255)
+    full_name: FullName | None = None
     phone_number: str | None = Field(None, min_length=7, max_length=32)
     subject: str = Field(..., min_length=3, max_length=500, description="Support request subject")
     message: str = Field(..., min_length=10, max_length=5000, description="Support request message")
-    source: str | None = Field("mobile", description="Origin of the request (mobile/web/api)")
+    source: TicketSource | None = Field("mobile", description="Origin of the request (mobile/web/api)")
 
 
 
 class TicketResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     id: str
-    ticket_id: str
+    ticket_id: TicketId
     email: str
     full_name: str | None
     phone_number: str | None
@@ -1,12 +1,14 @@
 import re, os
-from fastapi import HTTPException, status
-from sqlalchemy import select, update
+from fastapi import BackgroundTasks, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from app.platform.services.email import send_email
 from jinja2 import Environment, FileSystemLoader, ChoiceLoader
 from app.platform.config import settings
 from pathlib import Path
+from app.platform.logger import get_logger
 
 
 from app.features.support.models.support_ticket import (
@@ -17,6 +19,8 @@ from app.features.support.models.support_ticket import (
 )
 
 
+logger = get_logger(__name__)
+
 PRIORITY_KEYWORDS = {
     TicketPriority.URGENT: {"urgent", "critical", "emergency", "down"},
     TicketPriority.HIGH: {"important", "soon", "issue", "problem"},
@@ -28,8 +32,21 @@ CATEGORY_KEYWORDS = {
     TicketCategory.ACCOUNT: {"account", "login", "password"},
 }
 
+_WORD_RE = re.compile(r"\b\w+\b")
+
+# Built once per process; templates ship with the code so they're never reloaded
+_support_templates = Path(__file__).resolve().parent.parent / "template"
+_base_templates = Path(__file__).resolve().parents[2] / "auth" / "template"
+env = Environment(
+    loader=ChoiceLoader([FileSystemLoader(str(_support_templates)),
+                         FileSystemLoader(str(_base_templates))]),
+    auto_reload=False,
+)
+_ADMIN_TEMPLATE = env.get_template("admin_email.html")
+
+
 def _tokenize(text: str) -> set[str]:
-    return set(re.findall(r"\b\w+\b", text.lower()))
+    return set(_WORD_RE.findall(text.lower()))
 
 
 class TicketService:
@@ -38,20 +55,25 @@ class TicketService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    def _auto_detect_priority(self, subject: str, message: str) -> TicketPriority:
-        words = _tokenize(f"{subject} {message}")
+    @staticmethod
+    def _priority_from_words(words: set[str]) -> TicketPriority:
         for level in (TicketPriority.URGENT, TicketPriority.HIGH):
             if words & PRIORITY_KEYWORDS[level]:
                 return level
         return TicketPriority.MEDIUM
 
-    def _auto_categorize(self, subject: str, message: str) -> TicketCategory:
-        words = _tokenize(f"{subject} {message}")
+    @staticmethod
+    def _category_from_words(words: set[str]) -> TicketCategory:
         for category, keywords in CATEGORY_KEYWORDS.items():
             if words & keywords:
                 return category
         return TicketCategory.GENERAL
 
+    def _classify(self, subject: str, message: str) -> tuple[TicketPriority, TicketCategory]:
+        """Tokenize the ticket once and derive both priority and category from it."""
+        words = _tokenize(f"{subject} {message}")
+        return self._priority_from_words(words), self._category_from_words(words)
+
 
     async def create_ticket(
         self,
@@ -77,6 +99,8 @@ class TicketService:
             # Take first 50 chars of message as subject
             subject = f"Contact Form: {message[:50]}..." if len(message) > 50 else f"Contact Form: {message}"
 
+        priority, category = self._classify(subject, message)
+
         for _ in range(2):  # one retry if unique ticket_id collides
             ticket = SupportTicket(
                  email=email,
@@ -84,16 +108,15 @@ class TicketService:
                 phone_number=phone_number,
                 subject=subject,
                 message=message,
-                priority=self._auto_detect_priority(subject, message),
+                priority=priority,
                 status=TicketStatus.PENDING,
-                category=self._auto_categorize(subject, message),
+                category=category,
                 source=source
             )
             self.db.add(ticket)
             
             try:
                 await self.db.commit()
-                await self.db.refresh(ticket)
                 return ticket
             except IntegrityError:
                 await self.db.rollback()
@@ -105,8 +128,10 @@ class TicketService:
 
     async def get_ticket_by_id(self, ticket_id: str) -> SupportTicket | None:
         """Get ticket by ticket ID"""
+        # lambda_stmt caches the constructed statement; ticket_id is picked up
+        # from the closure as a bound parameter on each call
         result = await self.db.execute(
-            select(SupportTicket).where(SupportTicket.ticket_id == ticket_id)
+            lambda_stmt(lambda: select(SupportTicket).where(SupportTicket.ticket_id == ticket_id))
         )
         return result.scalar_one_or_none()
     
@@ -136,22 +161,32 @@ class TicketService:
     
 
     @staticmethod
-    async def send_ticket_notification(ticket) -> None:
-        support_templates = Path(__file__).resolve().parent.parent / "template"
-        base_template = Path(__file__).resolve().parent.parent.parent / "auth" / "template"
-
-
-        env = Environment(
-        loader=ChoiceLoader([
-            FileSystemLoader(str(support_templates)),
-            FileSystemLoader(str(base_template)),
-        ])
-    )
-        template = env.get_template("admin_email.html")
-        html_content = template.render(ticket=ticket)  
-
+    def notify_admin(ticket, raise_errors: bool = False) -> None:
+        """
+        Render and send the new-ticket email to the admin inbox (blocking).
+        With raise_errors, a failed send raises so the caller can retry.
+        """
+        html_content = _ADMIN_TEMPLATE.render(ticket=ticket)
 
         to_email = settings.MAIL_ADMIN_EMAIL
-        print(settings.MAIL_ADMIN_EMAIL)
-        send_email(to_email, f"New Ticket for {ticket.ticket_id}", html_content)
+        send_email(to_email, f"New Ticket for {ticket.ticket_id}", html_content, raise_errors=raise_errors)
 
+    @staticmethod
+    async def enqueue_ticket_notification(ticket, background_tasks: BackgroundTasks) -> None:
+        """
+        Hand the admin notification to the Celery worker; fall back to an
+        in-process background task if the broker can't be reached.
+        """
+        from app.features.support.workers.tasks import send_ticket_notification
+
+        try:
+            # Publishing is a blocking broker round trip; when the broker is
+            # down it waits out the connection timeout, so keep it off the loop
+            await run_in_threadpool(
+                send_ticket_notification.apply_async, args=[ticket.ticket_id], retry=False
+            )
+        except Exception as e:
+            logger.warning(f"Could not queue notification for {ticket.ticket_id}, sending in-process: {e}")
+            # notify_admin is sync, so Starlette runs it in the threadpool
+            # rather than blocking the event loop on SMTP
+            background_tasks.add_task(TicketService.notify_admin, ticket)
@@ -2,6 +2,32 @@ from datetime import datetime, timezone
 
 import httpx
 
+from app.platform.logger import get_logger
+
+logger = get_logger(__name__)
+
+# One pooled client per process so back-to-back contact submissions reuse the
+# keep-alive connection instead of a fresh TCP + TLS handshake each time
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _client
+
+
+async def close_webhook_client() -> None:
+    """Close the shared webhook client; called on application shutdown."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 async def send_contact_webhook(
     name: str,
@@ -33,17 +59,16 @@ async def send_contact_webhook(
         payload["page"] = page
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                webhook_url, json=payload, headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            if response.status_code != 200:
-                print(f"Make.com webhook returned {response.status_code}: {response.text}")
+        response = await _get_client().post(
+            webhook_url, json=payload, headers={"Content-Type": "application/json"}
+        )
+        response.raise_for_status()
+        if response.status_code != 200:
+            logger.warning(f"Make.com webhook returned {response.status_code}: {response.text}")
 
-            response.raise_for_status()
-            print(f"Successfully sent to Make.com webhook: {payload}")
+        response.raise_for_status()
+        logger.info(f"Successfully sent to Make.com webhook: {payload}")
 
     except Exception as e:
         # Log error but don't fail the request
-        print(f"Failed to send webhook to Make.com: {e}")
+        logger.exception(f"Failed to send webhook to Make.com: {e}")
@@ -0,0 +1,53 @@
+"""
+Celery tasks for support ticket side effects.
+
+These run on a worker instead of in the API process so SMTP/relay latency
+never holds up a request, and failed sends are retried.
+"""
+import logging
+
+from celery import shared_task
+from sqlalchemy import select
+
+from app.features.support.models.support_ticket import SupportTicket
+from app.features.support.services.email_service import TicketService
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    bind=True,
+    name="app.features.support.workers.tasks.send_ticket_notification",
+    max_retries=3,
+    default_retry_delay=30,
+    ignore_result=True,
+)
+def send_ticket_notification(self, ticket_id: str):
+    """
+    Email the admin inbox about a newly created support ticket.
+
+    Args:
+        ticket_id: Public ticket ID (TKT-...) of the ticket to notify about
+    """
+    from app.features.scan.workers.tasks import get_sync_db
+
+    db = get_sync_db()
+
+    try:
+        ticket = db.execute(
+            select(SupportTicket).where(SupportTicket.ticket_id == ticket_id)
+        ).scalar_one_or_none()
+
+        if not ticket:
+            logger.error(f"Ticket {ticket_id} not found, skipping admin notification")
+            return
+
+        TicketService.notify_admin(ticket, raise_errors=True)
+        logger.info(f"Admin notified of ticket {ticket_id}")
+
+    except Exception as e:
+        logger.error(f"Failed to send notification for ticket {ticket_id}: {e}")
+        raise self.retry(exc=e) from e
+
+    finally:
+        db.close()
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 
 
 class WaitlistIn(BaseModel):
@@ -17,8 +17,7 @@ class WaitlistOut(BaseModel):
     # referred_by: str | None = None
     # referral_count: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class WaitlistResponse(BaseModel):
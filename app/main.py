@@ -1,34 +1,54 @@
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from app.api_routers.v1 import api_router
 from app.features.health.routes.health import router as health_router
+from app.features.support.services.webhook import close_webhook_client
 from app.features.waitlist.routes.waitlist import router as waitlist_router
 from app.platform.exceptions import add_exception_handlers
+from app.platform.response import APIJSONResponse
 
 # Configure logging to show INFO level messages
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await close_webhook_client()
+
+
 app = FastAPI(
-    title="Site Audit AI API", description="API for website auditing and analysis", version="1.0.0"
+    title="Site Audit AI API",
+    description="API for website auditing and analysis",
+    version="1.0.0",
+    default_response_class=APIJSONResponse,
+    lifespan=lifespan,
 )
 
-# Root endpoint for basic info
-@app.get("/", tags=["Info"])
-def root():
-    return {
+_ROOT_INFO = orjson.dumps(
+    {
         "app_name": "Site Audit AI API",
         "description": "AI-powered website health auditor for non-technical users.",
         "version": "1.0.0",
         "docs_url": "/docs",
         "api_base": "/api/v1",
     }
+)
+
+
+# Root endpoint for basic info
+@app.get("/", tags=["Info"])
+async def root():
+    return Response(content=_ROOT_INFO, media_type="application/json")
 
 app.add_middleware(
     CORSMiddleware,
@@ -10,16 +10,13 @@ from contextlib import asynccontextmanager
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.platform.config import settings
+from app.platform.db.session import engine_options
 
 # Create async engine for notifications from Celery tasks
 async_engine = create_async_engine(
     settings.DATABASE_URL,
     echo=False,
-    pool_pre_ping=True,
-    pool_size=10,  
-    max_overflow=10, 
-    pool_timeout=30,
-    pool_recycle=1800,
+    **engine_options(pool_size=10, max_overflow=10),
 )
 AsyncSessionLocal = async_sessionmaker(
     async_engine, class_=AsyncSession, expire_on_commit=False
@@ -16,6 +16,8 @@ def create_celery_app() -> Celery:
     - scan.extraction: Data extraction from HTML
     - scan.analysis: LLM analysis tasks
     - scan.aggregation: Final score aggregation tasks
+    - notifications: Outbound email for support tickets (SMTP-bound, kept
+      apart so a slow relay never delays scan work)
     
     Note: ScrapingService returns serializable data (HTML + metadata)
     instead of WebDriver objects, allowing proper task separation.
@@ -54,6 +56,8 @@ def create_celery_app() -> Celery:
             # Periodic tasks go to default celery queue
             "app.features.scan.workers.periodic_tasks.check_and_trigger_periodic_scans": {"queue": "celery"},
             "app.features.scan.workers.periodic_tasks.send_scan_completion_email": {"queue": "celery"},
+            # Support ticket emails
+            "app.features.support.workers.tasks.send_ticket_notification": {"queue": "notifications"},
         },
         
         # Define queues
@@ -67,6 +71,7 @@ def create_celery_app() -> Celery:
             Queue("scan.extraction"),
             Queue("scan.analysis"),
             Queue("scan.aggregation"),
+            Queue("notifications"),
         ),
         
         # Default queue
@@ -89,8 +94,8 @@ def create_celery_app() -> Celery:
     )
     
 
-    # Auto-discover tasks in the workers module
-    celery_app.autodiscover_tasks(["app.features.scan.workers"])
+    # Auto-discover tasks in the workers modules
+    celery_app.autodiscover_tasks(["app.features.scan.workers", "app.features.support.workers"])
     
     return celery_app
 
@@ -6,6 +6,11 @@ from uuid_extension import uuid7
 Base = declarative_base()
 
 
+def utc_now():
+    """Current time as a naive UTC value, evaluated by the database."""
+    return sqlalchemy.func.timezone("UTC", sqlalchemy.func.now())
+
+
 class BaseModel(Base):
     __abstract__ = True
     id = Column(String, primary_key=True, default=lambda: str(uuid7()), index=True)
@@ -1,20 +1,69 @@
+from uuid import uuid4
+
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from app.platform.config import settings
 
+
+def pool_options(pool_size: int, max_overflow: int, pool_recycle: int = 1800) -> dict:
+    """Pool settings shared by the async and sync (Celery) engines."""
+    if settings.DATABASE_PGBOUNCER:
+        # PgBouncer already pools server connections
+        return {"poolclass": NullPool}
+    return {
+        "pool_pre_ping": True,
+        "pool_recycle": pool_recycle,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,  # (burst capacity)
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+    }
+
+
+def engine_options(pool_size: int, max_overflow: int) -> dict:
+    """Pool settings for an async engine, honouring DATABASE_PGBOUNCER."""
+    options = pool_options(pool_size, max_overflow)
+    if settings.DATABASE_PGBOUNCER:
+        # Transaction pooling hands each statement to whichever server
+        # connection is free, so named prepared statements must neither be
+        # cached nor reuse asyncpg's per-connection sequential names
+        options["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            "server_settings": {"jit": "off"},
+        }
+    return options
+
+
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=False,
     future=True,
-    pool_pre_ping=True,
-    pool_recycle=1800,
-    pool_size=20, 
-    max_overflow=30,  # (burst capacity)
-    pool_timeout=30, 
+    **engine_options(settings.DATABASE_POOL_SIZE, settings.DATABASE_MAX_OVERFLOW),
 )
 SessionLocal = async_sessionmaker(engine, expire_on_commit=False, autoflush=False, autocommit=False)
 
+# Separate pool for read-only hot paths so listing/lookup traffic doesn't
+# queue behind writes. Only worth its connections when it points at a
+# replica; otherwise reads share the primary pool.
+if settings.DATABASE_READ_URL:
+    read_engine = create_async_engine(
+        settings.DATABASE_READ_URL,
+        echo=False,
+        future=True,
+        **engine_options(settings.DATABASE_POOL_SIZE, max_overflow=10),
+    )
+    ReadSessionLocal = async_sessionmaker(read_engine, expire_on_commit=False, autoflush=False, autocommit=False)
+else:
+    read_engine = engine
+    ReadSessionLocal = SessionLocal
 
 async def get_db():
     async with SessionLocal() as session:
         yield session
+
+
+async def get_read_db():
+    async with ReadSessionLocal() as session:
+        yield session
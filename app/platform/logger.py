@@ -1,6 +1,8 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 # 1. Create the logs directory if it doesn't exist
 log_dir = os.path.join(os.getcwd(), "logs")
@@ -10,20 +12,18 @@ if not os.path.exists(log_dir):
 # 2. Define the path to the log file
 log_file_path = os.path.join(log_dir, "site_audit.log")
 
+_queue_handler: QueueHandler | None = None
 
-def get_logger(name: str):
+
+def _get_queue_handler() -> QueueHandler:
     """
-    Creates a logger instance that writes to console AND a file.
+    Shared handler that only enqueues records; formatting and the file and
+    console writes happen on the listener's background thread so request
+    handlers never block on log I/O.
     """
-    # Create a custom logger
-    logger = logging.getLogger(name)
-
-    # Prevent adding duplicate handlers
-    if logger.hasHandlers():
-        return logger
-
-    logger.setLevel(logging.INFO)
-    logger.propagate = False  # Prevent propagation to root logger
+    global _queue_handler
+    if _queue_handler is not None:
+        return _queue_handler
 
     # 3. Create Formatters (How the log looks)
     formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -38,8 +38,37 @@ def get_logger(name: str):
     console_handler.setFormatter(formatter)
     console_handler.setLevel(logging.INFO)
 
-    # Add handlers to the logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handlers = (file_handler, console_handler)
+
+    def start_listener():
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+
+    start_listener()
+    # The listener thread does not survive a fork (Celery prefork workers),
+    # so each child starts its own
+    os.register_at_fork(after_in_child=start_listener)
+
+    _queue_handler = QueueHandler(log_queue)
+    return _queue_handler
+
+
+def get_logger(name: str):
+    """
+    Creates a logger instance that writes to console AND a file.
+    """
+    # Create a custom logger
+    logger = logging.getLogger(name)
+
+    # Prevent adding duplicate handlers
+    if logger.hasHandlers():
+        return logger
+
+    logger.setLevel(logging.INFO)
+    logger.propagate = False  # Prevent propagation to root logger
+
+    logger.addHandler(_get_queue_handler())
 
     return logger
@@ -1,8 +1,29 @@
 from typing import Any, Optional
 
+import orjson
 from fastapi import status
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def _encode_fallback(obj: Any) -> Any:
+    # Pydantic models dump straight through pydantic-core; jsonable_encoder
+    # would dump them the same way and then walk the result again in Python
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True)
+    return jsonable_encoder(obj)
+
+
+class APIJSONResponse(ORJSONResponse):
+    """
+    orjson-backed response. Plain dicts, lists, datetimes, UUIDs and enums are
+    serialized natively, Pydantic models via model_dump, and anything else
+    falls back to jsonable_encoder.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_encode_fallback, option=orjson.OPT_NON_STR_KEYS)
 
 
 def api_response(
@@ -10,20 +31,19 @@ def api_response(
     data: Optional[Any] = None,
     message: str = "Operation successful",
     status_code: int = status.HTTP_200_OK,
-) -> JSONResponse:
+) -> APIJSONResponse:
     """
     Single source of truth for ALL API responses.
     Automatically sets status = "success" if < 400 else "error"
     """
     status_str = "success" if status_code < 400 else "error"
-    data = jsonable_encoder(data) if data is not None else {}
 
-    return JSONResponse(
+    return APIJSONResponse(
         status_code=status_code,
         content={
             "status_code": status_code,
             "status": status_str,
             "message": message,
-            "data": data,
+            "data": data if data is not None else {},
         },
     )
@@ -1,4 +1,6 @@
+import atexit
 import os
+import queue
 import smtplib
 import ssl
 import requests
@@ -21,11 +23,17 @@ if not os.path.exists(template_dir):
 
 env = Environment(loader=FileSystemLoader(template_dir))
 
+# Logged-in SMTP connections kept open between sends so each email doesn't
+# pay for a fresh TCP + TLS + AUTH handshake
+_SMTP_POOL_SIZE = 4
+_smtp_pool: "queue.LifoQueue[smtplib.SMTP]" = queue.LifoQueue(maxsize=_SMTP_POOL_SIZE)
 
-def send_email(to_email: str, subject: str, body: str):
+
+def send_email(to_email: str, subject: str, body: str, raise_errors: bool = False):
     """
     Send email via HTTP relay service
     Falls back to direct SMTP if relay is not configured.
+    SMTP failures are only logged unless raise_errors is set.
     """
     if settings.EMAIL_RELAY_URL and settings.EMAIL_RELAY_API_KEY:
         try:
@@ -35,13 +43,13 @@ def send_email(to_email: str, subject: str, body: str):
             logger.error(f"Email relay failed: {str(e)}")
             logger.info("Attempting direct SMTP as fallback...")
             try:
-                send_email_direct_smtp(to_email, subject, body)
+                send_email_direct_smtp(to_email, subject, body, raise_errors=raise_errors)
             except Exception as smtp_e:
                 logger.error(f"SMTP fallback also failed: {str(smtp_e)}")
                 raise smtp_e
     else:
         logger.warning("Email relay not configured, attempting direct SMTP")
-        send_email_direct_smtp(to_email, subject, body)
+        send_email_direct_smtp(to_email, subject, body, raise_errors=raise_errors)
 
 
 def send_email_via_relay(to_email: str, subject: str, body: str):
@@ -86,7 +94,54 @@ def send_email_via_relay(to_email: str, subject: str, body: str):
         logger.error(f"Unexpected error sending email via relay: {str(e)}")
         raise
 
-def send_email_direct_smtp(to_email: str, subject: str, body: str):
+def _connect_smtp() -> smtplib.SMTP:
+    port = settings.MAIL_PORT
+
+    if port == 465:
+        context = ssl.create_default_context()
+        server = smtplib.SMTP_SSL(settings.MAIL_HOST, port, context=context)
+    else:
+        server = smtplib.SMTP(settings.MAIL_HOST, port)
+        server.ehlo()
+
+        if str(settings.MAIL_ENCRYPTION).upper() in ["TLS", "TRUE"]:
+            server.starttls()
+            server.ehlo()
+
+    server.login(settings.MAIL_USERNAME, settings.MAIL_PASSWORD)
+    return server
+
+
+def _close_smtp(server: smtplib.SMTP) -> None:
+    try:
+        server.quit()
+    except Exception:
+        server.close()
+
+
+def _acquire_smtp() -> smtplib.SMTP:
+    """Take an idle connection that still answers NOOP, or open a new one."""
+    while True:
+        try:
+            server = _smtp_pool.get_nowait()
+        except queue.Empty:
+            return _connect_smtp()
+        try:
+            if server.noop()[0] == 250:
+                return server
+        except smtplib.SMTPException:
+            pass
+        _close_smtp(server)
+
+
+def _release_smtp(server: smtplib.SMTP) -> None:
+    try:
+        _smtp_pool.put_nowait(server)
+    except queue.Full:
+        _close_smtp(server)
+
+
+def send_email_direct_smtp(to_email: str, subject: str, body: str, raise_errors: bool = False):
     """Base function to send email via SMTP"""
     msg = MIMEMultipart("alternative")
     msg["Subject"] = subject
@@ -96,24 +151,32 @@ def send_email_direct_smtp(to_email: str, subject: str, body: str):
     msg.attach(MIMEText(body, "html"))
 
     try:
-        port = settings.MAIL_PORT
-        
-        if port == 465:
-            context = ssl.create_default_context()
-            with smtplib.SMTP_SSL(settings.MAIL_HOST, port, context=context) as server:
-                server.login(settings.MAIL_USERNAME, settings.MAIL_PASSWORD)
+        server = _acquire_smtp()
+        try:
+            try:
                 server.sendmail(settings.MAIL_FROM_ADDRESS, to_email, msg.as_string())
-        else:
-            with smtplib.SMTP(settings.MAIL_HOST, port) as server:
-                server.ehlo()
-
-                if str(settings.MAIL_ENCRYPTION).upper() in ["TLS", "TRUE"]:
-                    server.starttls()
-                    server.ehlo()
-
-                server.login(settings.MAIL_USERNAME, settings.MAIL_PASSWORD)
+            except smtplib.SMTPServerDisconnected:
+                # Server dropped the idle connection; retry once on a fresh one
+                _close_smtp(server)
+                server = _connect_smtp()
                 server.sendmail(settings.MAIL_FROM_ADDRESS, to_email, msg.as_string())
-
+        except Exception:
+            _close_smtp(server)
+            raise
+        _release_smtp(server)
 
     except Exception as e:
         logger.error(f"CRITICAL EMAIL ERROR: {str(e)}")
+        if raise_errors:
+            raise
+
+
+def _drain_smtp_pool() -> None:
+    while True:
+        try:
+            _close_smtp(_smtp_pool.get_nowait())
+        except queue.Empty:
+            return
+
+
+atexit.register(_drain_smtp_pool)
@@ -1,6 +1,14 @@
-from urllib.parse import urlparse, urlunparse
+import re
+from urllib.parse import parse_qsl, urlencode, urlparse, urlsplit, urlunparse, urlunsplit
 from typing import Tuple
 
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_ALLOWED_SCHEMES = ("http", "https")
+_TRACKING_PARAM_PREFIXES = ("utm_",)
+_TRACKING_PARAMS = frozenset(("gclid", "fbclid"))
+# Percent-escapes of RFC 3986 unreserved characters, e.g. %7E -> ~
+_UNRESERVED_ESCAPE_RE = re.compile(r"%(2[dDeE]|5[fF]|7[eE]|[46][1-9a-fA-F]|[57][0-9aA]|3[0-9])")
+
 
 def normalize_url(url: str) -> Tuple[str, bool]:
 
@@ -27,10 +35,39 @@ def validate_url(url: str) -> Tuple[bool, str, str]:
         if not parsed.netloc:
             return False, normalized_url, "Invalid URL format: missing domain"
         
-        if parsed.scheme not in ['http', 'https']:
+        if parsed.scheme not in _ALLOWED_SCHEMES:
             return False, normalized_url, f"Invalid URL scheme: {parsed.scheme} (must be http or https)"
         
         return True, normalized_url, ""
         
     except Exception as e:
-        return False, normalized_url, f"URL parsing error: {str(e)}"
\ No newline at end of file
+        return False, normalized_url, f"URL parsing error: {str(e)}"
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Canonical form used as the identity of a site (Site.root_url).
+
+    Lowercases scheme and host, drops default ports, the fragment, tracking
+    params and the trailing slash, sorts the remaining query params and
+    decodes escaped unreserved characters, so that e.g. ``HTTP://X.com:80/``
+    and ``http://x.com`` map to the same row.
+    """
+    url, _ = normalize_url(url)
+    parts = urlsplit(url)
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"  # IPv6 literal; hostname strips the brackets
+    port = parts.port
+    netloc = host if port is None or port == _DEFAULT_PORTS.get(scheme) else f"{host}:{port}"
+
+    path = _UNRESERVED_ESCAPE_RE.sub(lambda m: chr(int(m.group(1), 16)), parts.path).rstrip("/")
+
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k not in _TRACKING_PARAMS and not k.startswith(_TRACKING_PARAM_PREFIXES)
+    ))
+
+    return urlunsplit((scheme, netloc, path, query, ""))
@@ -5,8 +5,10 @@ Manages WebSocket connections for real-time notifications.
 Tracks active connections per user and provides methods to send messages.
 """
 
+import asyncio
 from typing import Dict, List
 
+import orjson
 from fastapi import WebSocket
 from starlette.websockets import WebSocketState
 
@@ -79,30 +81,7 @@ class ConnectionManager:
             logger.debug(f"User {user_id} is not connected. Message not delivered.")
             return 0
 
-        connections = self.active_connections[user_id]
-        successful_sends = 0
-        failed_connections = []
-
-        for connection in connections:
-            try:
-                # Check if connection is still open
-                if connection.client_state == WebSocketState.CONNECTED:
-                    await connection.send_json(message)
-                    successful_sends += 1
-                else:
-                    failed_connections.append(connection)
-            except Exception as e:
-                logger.warning(f"Failed to send message to user {user_id}: {e}")
-                failed_connections.append(connection)
-
-        # Clean up failed connections
-        for failed_connection in failed_connections:
-            await self.disconnect(failed_connection, user_id)
-
-        logger.info(
-            f"Sent message to user {user_id}. Successful: {successful_sends}, Failed: {len(failed_connections)}"
-        )
-        return successful_sends
+        return await self._deliver(orjson.dumps(message).decode(), user_id)
 
     async def broadcast(self, message: dict):
         """
@@ -114,14 +93,45 @@ class ConnectionManager:
         Returns:
             Number of successful deliveries
         """
-        total_sent = 0
-        for user_id in list(self.active_connections.keys()):
-            sent = await self.send_personal_message(message, user_id)
-            total_sent += sent
+        payload = orjson.dumps(message).decode()
+        sent = await asyncio.gather(
+            *(self._deliver(payload, user_id) for user_id in list(self.active_connections))
+        )
+        total_sent = sum(sent)
 
         logger.info(f"Broadcast message to {total_sent} connections")
         return total_sent
 
+    async def _deliver(self, payload: str, user_id: str) -> int:
+        """Send an encoded message to every device of a user concurrently."""
+        connections = list(self.active_connections.get(user_id, ()))
+        results = await asyncio.gather(
+            *(self._send(connection, payload, user_id) for connection in connections)
+        )
+        successful_sends = sum(results)
+        failed_connections = [c for c, ok in zip(connections, results) if not ok]
+
+        # Clean up failed connections
+        for failed_connection in failed_connections:
+            await self.disconnect(failed_connection, user_id)
+
+        logger.info(
+            f"Sent message to user {user_id}. Successful: {successful_sends}, Failed: {len(failed_connections)}"
+        )
+        return successful_sends
+
+    @staticmethod
+    async def _send(connection: WebSocket, payload: str, user_id: str) -> bool:
+        try:
+            # Check if connection is still open
+            if connection.client_state != WebSocketState.CONNECTED:
+                return False
+            await connection.send_text(payload)
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to send message to user {user_id}: {e}")
+            return False
+
     def get_active_user_count(self) -> int:
         """Get the number of users with at least one active connection."""
         return len(self.active_connections)
@@ -8,6 +8,7 @@ from unittest.mock import Mock, patch, MagicMock
 from fastapi import HTTPException
 
 from app.features.scan.services.discovery.page_discovery import PageDiscoveryService
+from app.platform.utils.url_validator import canonicalize_url
 
 
 class TestPageDiscoveryService:
@@ -157,3 +158,26 @@ class TestDiscoverUrlsEndpoint:
         
         # Should return 400 or 422 for invalid URL format
         assert response.status_code in [400, 422]
+
+
+class TestCanonicalizeUrl:
+    """Tests for the canonical site URL form"""
+
+    def test_equivalent_urls_share_canonical_form(self):
+        """Case, default port and trailing slash variants collapse to one URL"""
+        variants = ["http://x.com", "http://x.com/", "HTTP://X.COM/", "http://x.com:80"]
+        assert {canonicalize_url(u) for u in variants} == {"http://x.com"}
+
+    def test_strips_tracking_params_and_sorts_query(self):
+        """Tracking params and fragments are dropped, remaining params are sorted"""
+        url = "https://x.com/a/%7Euser/?utm_source=news&b=2&a=1#top"
+        assert canonicalize_url(url) == "https://x.com/a/~user?a=1&b=2"
+
+    def test_keeps_non_default_port_and_path_case(self):
+        """Only scheme and host are case-insensitive"""
+        assert canonicalize_url("https://X.com:8443/Path/") == "https://x.com:8443/Path"
+
+    def test_keeps_brackets_around_ipv6_hosts(self):
+        """IPv6 literals stay bracketed so the port remains unambiguous"""
+        assert canonicalize_url("http://[::1]:8080/a") == "http://[::1]:8080/a"
+        assert canonicalize_url("https://[::1]:443/") == "https://[::1]"